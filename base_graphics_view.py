@@ -1,6 +1,8 @@
 """
 Base Graphics View with pan and zoom functionality
 """
+import weakref
+
 from PySide2.QtWidgets import QGraphicsView
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QMouseEvent
@@ -13,6 +15,20 @@ class BaseGraphicsView(QGraphicsView):
         self.is_panning    = False
         self.pan_start_pos = None
         self.selected_node = None
+        self._main_window_ref = None
+
+    def set_main_window(self, main_window):
+        """
+        Register the window that hosts this view.  Only a weak reference is
+        kept, so the view never extends the window's lifetime.
+        """
+        self._main_window_ref = (weakref.ref(main_window)
+                                 if main_window is not None else None)
+
+    def main_window(self):
+        """The registered main window, or None if unset or already gone."""
+        ref = self._main_window_ref
+        return ref() if ref is not None else None
 
     def select_node_visually(self, node):
         self.selected_node = node
@@ -16,8 +16,10 @@ This means ANY output port value (float, tuple, bool, …) can be delivered to
 ANY compatible input port purely through wires, with no special handling.
 """
 
+from collections import defaultdict, deque
+
 from PySide2.QtWidgets import QGraphicsScene, QGraphicsPathItem, QGraphicsView
-from PySide2.QtCore import Qt, Signal, QPointF
+from PySide2.QtCore import Qt, Signal, Slot, QPointF, QTimer
 from PySide2.QtGui import QPainter, QBrush, QColor, QPen, QPainterPath
 
 from .models import *
@@ -67,6 +69,19 @@ class ConnectionWire(QGraphicsPathItem):
         self.update_path()
 
 
+class _PortWire:
+    """A drawn wire and the two node items / ports it joins."""
+
+    __slots__ = ('wire', 'from_item', 'to_item', 'from_port', 'to_port')
+
+    def __init__(self, wire, from_item, to_item, from_port, to_port):
+        self.wire      = wire
+        self.from_item = from_item
+        self.to_item   = to_item
+        self.from_port = from_port
+        self.to_port   = to_port
+
+
 class FlowchartScene(QGraphicsScene):
 
     node_selected            = Signal(object)
@@ -75,8 +90,9 @@ class FlowchartScene(QGraphicsScene):
     def __init__(self):
         super().__init__()
         self.nodes       = {}
+        self.node_items  = {}   # node_id → FlowchartNodeItem
         self.connections = []   # list of {from, from_port, to, to_port}
-        self.port_wires  = []   # list of wire-data dicts
+        self.port_wires  = []   # list of _PortWire records
         self.selected_node = None
 
         self.connection_in_progress = False
@@ -86,6 +102,13 @@ class FlowchartScene(QGraphicsScene):
 
         self.undo_stack = UndoStack(max_depth=100)
 
+        # Editor changes arrive once per keystroke / spin step; coalesce
+        # each burst into a single preview rebuild, at most once a frame.
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(16)
+        self._preview_timer.timeout.connect(self.preview_update_requested.emit)
+
     # ------------------------------------------------------------------
     # Port classification helpers
     # ------------------------------------------------------------------
@@ -99,7 +122,7 @@ class FlowchartScene(QGraphicsScene):
     def _is_port_connected(self, node_item, port_name):
         return any(
             w for w in self.port_wires
-            if w['to_item'] is node_item and w['to_port'] == port_name
+            if w.to_item is node_item and w.to_port == port_name
         )
 
     def can_connect(self, from_item, from_port, to_item, to_port):
@@ -122,13 +145,13 @@ class FlowchartScene(QGraphicsScene):
             if is_in and self._is_port_connected(node_item, port_name):
                 wire_data = next(
                     (w for w in self.port_wires
-                     if w['to_item'] is node_item and w['to_port'] == port_name),
+                     if w.to_item is node_item and w.to_port == port_name),
                     None,
                 )
                 if wire_data:
                     cmd = RemoveConnectionCommand(
                         self,
-                        wire_data['from_item'], wire_data['from_port'],
+                        wire_data.from_item, wire_data.from_port,
                         node_item, port_name,
                     )
                     self.undo_stack.push(cmd)
@@ -181,20 +204,18 @@ class FlowchartScene(QGraphicsScene):
         self.connection_start_port  = None
 
     def connect_nodes_with_wire(self, from_node, to_node,
-                                from_port: str, to_port: str):
+                                from_port: str, to_port: str,
+                                replace_existing: bool = True):
         """
         Draw a wire between two nodes and register the connection.
 
         Called by AddConnectionCommand.redo() and load_file().
-        Replaces any existing wire on the destination input port first.
+        Replaces any existing wire on the destination input port first;
+        bulk loaders that already guarantee one wire per input pass
+        replace_existing=False to skip that scan of every wire.
         """
-        from_item = to_item = None
-        for i in self.items():
-            if isinstance(i, FlowchartNodeItem):
-                if i.node is from_node:
-                    from_item = i
-                elif i.node is to_node:
-                    to_item = i
+        from_item = self.node_items.get(from_node.id)
+        to_item   = self.node_items.get(to_node.id)
 
         if not (from_item and to_item):
             return
@@ -202,7 +223,8 @@ class FlowchartScene(QGraphicsScene):
             return
 
         # Remove any existing wire on to_port (inputs accept only one wire)
-        self._disconnect_input_port(to_item, to_port, record_undo=False)
+        if replace_existing:
+            self._disconnect_input_port(to_item, to_port, record_undo=False)
 
         sp = from_item.get_port_scene_pos(from_port)
         ep = to_item.get_port_scene_pos(to_port)
@@ -214,13 +236,8 @@ class FlowchartScene(QGraphicsScene):
         wire.to_port   = to_port
         self.addItem(wire)
 
-        self.port_wires.append({
-            'wire':      wire,
-            'from_item': from_item,
-            'to_item':   to_item,
-            'from_port': from_port,
-            'to_port':   to_port,
-        })
+        self.port_wires.append(
+            _PortWire(wire, from_item, to_item, from_port, to_port))
         self.connections.append({
             'from':      from_node.id,
             'to':        to_node.id,
@@ -243,22 +260,22 @@ class FlowchartScene(QGraphicsScene):
         if record_undo:
             wire_data = next(
                 (w for w in self.port_wires
-                 if w['to_item'] is node_item and w['to_port'] == port_name),
+                 if w.to_item is node_item and w.to_port == port_name),
                 None,
             )
             if wire_data:
                 cmd = RemoveConnectionCommand(
                     self,
-                    wire_data['from_item'], wire_data['from_port'],
+                    wire_data.from_item, wire_data.from_port,
                     node_item, port_name,
                 )
                 self.undo_stack.push(cmd)
                 return
 
         stale = [w for w in self.port_wires
-                 if w['to_item'] is node_item and w['to_port'] == port_name]
+                 if w.to_item is node_item and w.to_port == port_name]
         for w in stale:
-            self.removeItem(w['wire'])
+            self.removeItem(w.wire)
             self.port_wires.remove(w)
             self.connections = [
                 c for c in self.connections
@@ -295,39 +312,36 @@ class FlowchartScene(QGraphicsScene):
         """
         # Build adjacency for topological sort over the connection graph
         ids       = list(self.nodes.keys())
-        in_degree = {nid: 0 for nid in ids}
-        adj       = {nid: [] for nid in ids}
+        in_degree = dict.fromkeys(ids, 0)
+        adj       = defaultdict(list)
 
         for conn in self.connections:
             f, t = conn['from'], conn['to']
-            if f in adj and t in in_degree:
+            if f in in_degree and t in in_degree:
                 adj[f].append(conn)
                 in_degree[t] += 1
 
-        from collections import deque
         queue  = deque(nid for nid in ids if in_degree[nid] == 0)
         order  = []
         while queue:
             nid = queue.popleft()
             order.append(nid)
-            for conn in adj[nid]:
+            for conn in adj.get(nid, ()):
                 t = conn['to']
                 in_degree[t] -= 1
                 if in_degree[t] == 0:
                     queue.append(t)
 
-        # Walk in topological order and push each wire's value
+        # Walk in topological order and push each wire's value.  adj[nid]
+        # already holds exactly the wires leaving nid, in connection order,
+        # and both endpoints are known to exist.
+        nodes = self.nodes
+        push  = self._push_wire_value
         for nid in order:
-            for conn in self.connections:
-                if conn['from'] != nid:
-                    continue
-                from_node = self.nodes.get(conn['from'])
-                to_node   = self.nodes.get(conn['to'])
-                if from_node and to_node:
-                    self._push_wire_value(
-                        from_node, conn['from_port'],
-                        to_node,   conn['to_port'],
-                    )
+            from_node = nodes[nid]
+            for conn in adj.get(nid, ()):
+                push(from_node, conn['from_port'],
+                     nodes[conn['to']], conn['to_port'])
 
     # ------------------------------------------------------------------
     # Mouse move (temp wire)
@@ -353,6 +367,7 @@ class FlowchartScene(QGraphicsScene):
             item = FlowchartNodeItem(node, x, y)
 
         self.addItem(item)
+        self.node_items[node.id] = item
         return item
 
     def _remove_node_item(self, item, record_undo=True):
@@ -367,20 +382,21 @@ class FlowchartScene(QGraphicsScene):
 
         # Disconnect all wires touching this node
         for w in [d for d in self.port_wires
-                  if d['from_item'] is item or d['to_item'] is item]:
-            self.removeItem(w['wire'])
-            peer  = w['to_item']   if w['from_item'] is item else w['from_item']
-            pport = w['to_port']   if w['from_item'] is item else w['from_port']
+                  if d.from_item is item or d.to_item is item]:
+            self.removeItem(w.wire)
+            peer  = w.to_item   if w.from_item is item else w.from_item
+            pport = w.to_port   if w.from_item is item else w.from_port
             if pport in peer.ports:
                 peer.ports[pport].set_connected(False)
 
         self.port_wires  = [w for w in self.port_wires
-                            if w['from_item'] is not item and
-                               w['to_item']   is not item]
+                            if w.from_item is not item and
+                               w.to_item   is not item]
         self.connections = [c for c in self.connections
                             if c['from'] != node.id and c['to'] != node.id]
         if node.id in self.nodes:
             del self.nodes[node.id]
+        self.node_items.pop(node.id, None)
         self.removeItem(item)
         self.request_preview_update()
         return True
@@ -394,15 +410,16 @@ class FlowchartScene(QGraphicsScene):
 
     def update_port_wires(self, moved_item):
         for w in self.port_wires:
-            if w['from_item'] is moved_item:
-                w['wire'].start_pos = moved_item.get_port_scene_pos(w['from_port'])
-                w['wire'].update_path()
-            if w['to_item'] is moved_item:
-                w['wire'].end_pos = moved_item.get_port_scene_pos(w['to_port'])
-                w['wire'].update_path()
+            if w.from_item is moved_item:
+                w.wire.start_pos = moved_item.get_port_scene_pos(w.from_port)
+                w.wire.update_path()
+            if w.to_item is moved_item:
+                w.wire.end_pos = moved_item.get_port_scene_pos(w.to_port)
+                w.wire.update_path()
 
     def request_preview_update(self):
-        self.preview_update_requested.emit()
+        """Schedule a preview rebuild; repeated calls within 16 ms coalesce."""
+        self._preview_timer.start()
 
 
 # ---------------------------------------------------------------------------
@@ -519,12 +536,9 @@ class FlowchartView(BaseGraphicsView):
         super().keyPressEvent(event)
 
     def _emit_status(self, msg: str):
-        widget = self.parentWidget()
-        while widget:
-            if hasattr(widget, 'statusBar'):
-                widget.statusBar().showMessage(msg, 3000)
-                return
-            widget = widget.parentWidget()
+        mw = self.main_window()
+        if mw is not None:
+            mw.statusBar().showMessage(msg, 3000)
 
     # ------------------------------------------------------------------
     # Drag tracking
@@ -601,11 +615,13 @@ class FlowchartView(BaseGraphicsView):
 
     def select_node_visually(self, node):
         self.selected_node = node
-        for item in self.scene.items():
-            if isinstance(item, FlowchartNodeItem):
-                item.setSelected(item.node is node)
-                if item.node is node:
-                    self.centerOn(item)
+        target = self.scene.node_items.get(node.id)
+        for item in self.scene.selectedItems():
+            if item is not target:
+                item.setSelected(False)
+        if target is not None:
+            target.setSelected(True)
+            self.centerOn(target)
 
     def restore_drag_mode(self):
         self.setDragMode(QGraphicsView.RubberBandDrag)
@@ -613,6 +629,7 @@ class FlowchartView(BaseGraphicsView):
     def create_start_node(self):
         self.scene.add_flowchart_node(StartNode("START", "START"), 50, 50)
 
+    @Slot(object)
     def on_node_selected(self, node):
         self.scene.selected_node = node
 
@@ -672,6 +689,3 @@ class FlowchartView(BaseGraphicsView):
         node_name = self._next_type_name(node_type)
         node = create_node_from_type(node_type, node_id, node_name)
         return self._add_node(node, x, y)
-
-    def get_next_node_id(self):
-        return self._next_id()
@@ -10,9 +10,9 @@ from PySide2.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                QApplication, QDialog)
 
 from .open_dialog import OpenComponentDialog
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, Slot
 
-from .flowchart import FlowchartNodeItem, FlowchartView, _prefix_for_type
+from .flowchart import FlowchartView, _prefix_for_type
 from .preview import GeometryPreview
 from .panels import ToolboxPanel
 from .models import create_node_from_dict
@@ -53,6 +53,7 @@ class ComponentDesigner(QMainWindow):
         flowchart_label     = QLabel("Flowchart")
         flowchart_label.setStyleSheet(theme.PANEL_LABEL_STYLE)
         self.flowchart = FlowchartView()
+        self.flowchart.set_main_window(self)
         flowchart_layout.addWidget(flowchart_label)
         flowchart_layout.addWidget(self.flowchart)
         flowchart_layout.setContentsMargins(0, 0, 0, 0)
@@ -178,6 +179,7 @@ class ComponentDesigner(QMainWindow):
         help_menu = menubar.addMenu("Help")
         help_menu.addAction(self.about_action)
 
+    @Slot()
     def _refresh_edit_menu(self):
         stack = self.flowchart.undo_stack
         if stack.can_undo():
@@ -215,46 +217,53 @@ class ComponentDesigner(QMainWindow):
         self.show_comments_check.stateChanged.connect(self.toggle_comments)
         self.flowchart.scene.node_selected.connect(self.on_flowchart_node_selected)
         self.flowchart.scene.preview_update_requested.connect(self.update_preview)
+        self.preview.node_clicked.connect(self.sync_selection_from_preview)
 
     # ------------------------------------------------------------------
     # Undo / Redo
     # ------------------------------------------------------------------
 
+    @Slot()
     def do_undo(self):
         desc = self.flowchart.undo_stack.undo()
         if desc:
             self.statusBar().showMessage(f"Undo: {desc}", 3000)
             self.modified = True
-            self.update_preview()
+            self.flowchart.scene.request_preview_update()
 
+    @Slot()
     def do_redo(self):
         desc = self.flowchart.undo_stack.redo()
         if desc:
             self.statusBar().showMessage(f"Redo: {desc}", 3000)
             self.modified = True
-            self.update_preview()
+            self.flowchart.scene.request_preview_update()
 
     # ------------------------------------------------------------------
     # Selection
     # ------------------------------------------------------------------
 
+    @Slot(object)
     def on_flowchart_node_selected(self, node):
         self.statusBar().showMessage(f"Selected: {node.type} - {node.name}")
         self.preview.select_node_visually(node)
 
+    @Slot(object)
     def sync_selection_from_preview(self, node):
         self.statusBar().showMessage(f"Selected: {node.type} - {node.name}")
         self.flowchart.select_node_visually(node)
 
+    @Slot(str)
     def add_element_to_flowchart(self, element_type: str):
         self.flowchart.add_node_by_type(element_type)
         self.modified = True
-        self.update_preview()
+        self.flowchart.scene.request_preview_update()
 
     # ------------------------------------------------------------------
     # Preview update  —  single entry point, no special-case resolvers
     # ------------------------------------------------------------------
 
+    @Slot()
     def update_preview(self):
         """
         Propagate all wire values (topological order) then redraw the preview.
@@ -270,22 +279,26 @@ class ComponentDesigner(QMainWindow):
             connections=self.flowchart.scene.connections,
         )
 
+    @Slot(int)
     def toggle_codes(self, state):
         self.preview.show_codes = (state == Qt.Checked)
-        self.update_preview()
+        self.flowchart.scene.request_preview_update()
 
+    @Slot(int)
     def toggle_comments(self, state):
         self.preview.show_comments = (state == Qt.Checked)
-        self.update_preview()
+        self.flowchart.scene.request_preview_update()
 
     # ------------------------------------------------------------------
     # File operations
     # ------------------------------------------------------------------
 
+    @Slot()
     def new_file(self):
         if self.check_save_changes():
             self.flowchart.scene.clear()
             self.flowchart.scene.nodes.clear()
+            self.flowchart.scene.node_items.clear()
             self.flowchart.scene.connections.clear()
             self.flowchart.scene.port_wires.clear()
             self.flowchart.node_counter = 0
@@ -298,6 +311,7 @@ class ComponentDesigner(QMainWindow):
             self.modified     = False
             self.statusBar().showMessage("New component created")
 
+    @Slot()
     def open_file(self):
         initial_dir = (os.path.dirname(self.current_file)
                        if self.current_file else os.path.expanduser('~'))
@@ -307,12 +321,14 @@ class ComponentDesigner(QMainWindow):
             if path:
                 self.load_file(path)
 
+    @Slot()
     def save_file(self):
         if self.current_file:
             self.save_to_file(self.current_file)
         else:
             self.save_file_as()
 
+    @Slot()
     def save_file_as(self):
         initial_dir = (os.path.dirname(self.current_file)
                        if self.current_file else os.path.expanduser('~'))
@@ -410,19 +426,21 @@ class ComponentDesigner(QMainWindow):
 
             self.flowchart.scene.clear()
             self.flowchart.scene.nodes.clear()
+            self.flowchart.scene.node_items.clear()
             self.flowchart.scene.connections.clear()
             self.flowchart.scene.port_wires.clear()
             self.flowchart.node_counter = 0
             self.flowchart._type_counters.clear()
+            # Every preview item belongs to a node being replaced; drop
+            # them in one clear() rather than one removeItem per item.
+            self.preview.scene.clear()
+            self.preview.setup_scene()
 
             node_map = {}
             for node_data in data.get('nodes', []):
                 node      = create_node_from_dict(node_data)
                 x, y      = node_data.get('x', 0), node_data.get('y', 0)
-                node.x, node.y = x, y
-                self.flowchart.scene.nodes[node.id] = node
-                item = FlowchartNodeItem(node, x, y)
-                self.flowchart.scene.addItem(item)
+                self.flowchart.scene.add_flowchart_node(node, x, y)
                 node_map[node.id] = node
 
                 # Restore global ID counter
@@ -471,15 +489,19 @@ class ComponentDesigner(QMainWindow):
                     })
 
             all_connections = data.get('connections', []) + legacy_conns
-            # Deduplicate (to_id + to_port uniquely identifies an input)
+            # Deduplicate (to_id + to_port uniquely identifies an input).
+            # to_port defaults exactly as in the connect loop below, so a
+            # saved wire without one collides with its legacy twin.
             seen = set()
             deduped = []
             for conn in all_connections:
-                key = (conn['to'], conn.get('to_port', ''))
+                key = (conn['to'], conn.get('to_port', 'reference'))
                 if key not in seen:
                     seen.add(key)
                     deduped.append(conn)
 
+            # deduped holds at most one wire per input port and the scene
+            # was just cleared, so no existing wire needs replacing.
             for conn in deduped:
                 from_id   = conn['from']
                 to_id     = conn['to']
@@ -489,6 +511,7 @@ class ComponentDesigner(QMainWindow):
                     self.flowchart.scene.connect_nodes_with_wire(
                         node_map[from_id], node_map[to_id],
                         from_port, to_port,
+                        replace_existing=False,
                     )
 
             self.flowchart.undo_stack.clear()
@@ -515,9 +538,11 @@ class ComponentDesigner(QMainWindow):
                 return False
         return True
 
+    @Slot()
     def restore_default_layout(self):
         pass
 
+    @Slot()
     def show_about(self):
         QMessageBox.about(
             self, "About",
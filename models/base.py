@@ -27,8 +27,10 @@ Port definition format
       Combo-box options list. Rendered as a ComboField.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 
 
 # ---------------------------------------------------------------------------
@@ -72,8 +74,14 @@ class DataType(Enum):
     SUPERELEVATION = "Superelevation"
 
 
+@lru_cache(maxsize=None)
 def _enum_options(enum_cls):
-    """Convert an Enum class into a list of label/value dicts for combo fields."""
+    """
+    Convert an Enum class into a list of label/value dicts for combo fields.
+
+    get_input_ports() is called on every port click and rebuild, so the list
+    is built once per enum and shared; callers must not mutate it.
+    """
     return [{'label': e.value, 'value': e} for e in enum_cls]
 
 
@@ -114,6 +122,32 @@ def unpack_port(port_def):
     return port_def, False
 
 
+@lru_cache(maxsize=1024)
+def _parse_codes_cached(text: str) -> tuple:
+    return tuple(sys.intern(s)
+                 for s in (c.strip() for c in text.split(',')) if s)
+
+
+def parse_codes(text: str) -> list:
+    """
+    Split a comma-separated code string into a list of codes.
+
+        'Top, Pave ,, ETW'  → ['Top', 'Pave', 'ETW']
+
+    Codes are interned: the same few names ("Top", "ETW", …) recur on many
+    nodes, so they share one string object each.
+    """
+    return list(_parse_codes_cached(text))
+
+
+def intern_codes(codes) -> list:
+    """
+    Return *codes* (e.g. loaded from JSON) as a list of interned strings.
+    Hand-edited files may hold numeric codes; those are stored as text.
+    """
+    return [sys.intern(str(c)) for c in codes]
+
+
 def port_type(port_def):
     t, _ = unpack_port(port_def)
     return t
@@ -33,7 +33,8 @@ import math
 from PySide2.QtCore import QPointF
 from PySide2.QtGui import QColor
 
-from .base import FlowchartNode, PointGeometryType, LinkType, _enum_options, port
+from .base import (FlowchartNode, PointGeometryType, LinkType, _enum_options,
+                   intern_codes, parse_codes, port)
 
 
 class PointNode(FlowchartNode):
@@ -130,7 +131,7 @@ class PointNode(FlowchartNode):
             self._compute()
         elif port_name == 'point_codes':
             if isinstance(value, str):
-                self.point_codes = [c.strip() for c in value.split(',') if c.strip()]
+                self.point_codes = parse_codes(value)
             elif isinstance(value, list):
                 self.point_codes = value
         elif port_name == 'add_link':
@@ -241,8 +242,8 @@ class PointNode(FlowchartNode):
         lbl = PreviewTextItem(self.name, self,
                               anchor_scene=anchor,
                               offset_screen=QPointF(8, -25),
-                              base_font_size=BASE_FONT_NODE_LABEL)
-        f = lbl.font(); f.setBold(True); lbl.setFont(f)
+                              base_font_size=BASE_FONT_NODE_LABEL,
+                              bold=True)
         lbl.setDefaultTextColor(QColor(0, 0, 180))
         items.append(lbl)
 
@@ -291,7 +292,7 @@ class PointNode(FlowchartNode):
         node.delta_y     = data.get('delta_y',  0.0)
         node.distance    = data.get('distance', 0.0)
         node.slope       = data.get('slope',    0.0)
-        node.point_codes = data.get('point_codes', [])
+        node.point_codes = intern_codes(data.get('point_codes', []))
         node.add_link    = data.get('add_link', False)
         # Legacy support: old files stored from_point as a node-id reference.
         # We keep it only for the preview renderer's topology sort.
@@ -362,7 +363,7 @@ class LinkNode(FlowchartNode):
             self._compute()
         elif port_name == 'link_codes':
             if isinstance(value, str):
-                self.link_codes = [c.strip() for c in value.split(',') if c.strip()]
+                self.link_codes = parse_codes(value)
             elif isinstance(value, list):
                 self.link_codes = value
         elif hasattr(self, port_name):
@@ -445,8 +446,8 @@ class LinkNode(FlowchartNode):
             t = PreviewTextItem(self.name, self,
                                 anchor_scene=anchor,
                                 offset_screen=QPointF(0, -30),
-                                base_font_size=BASE_FONT_NODE_LABEL)
-            f = t.font(); f.setBold(True); t.setFont(f)
+                                base_font_size=BASE_FONT_NODE_LABEL,
+                                bold=True)
             t.setDefaultTextColor(QColor(0, 100, 0))
             items.append(t)
 
@@ -486,7 +487,7 @@ class LinkNode(FlowchartNode):
         node = cls(data['id'], data['name'])
         node.x          = data.get('x', 0)
         node.y          = data.get('y', 0)
-        node.link_codes = data.get('link_codes', [])
+        node.link_codes = intern_codes(data.get('link_codes', []))
         # Legacy: old files stored start_point/end_point as node IDs.
         node._legacy_start_point = data.get('start_point')
         node._legacy_end_point   = data.get('end_point')
@@ -533,7 +534,7 @@ class ShapeNode(FlowchartNode):
         node = cls(data['id'], data['name'])
         node.x           = data.get('x', 0)
         node.y           = data.get('y', 0)
-        node.shape_codes = data.get('shape_codes', [])
+        node.shape_codes = intern_codes(data.get('shape_codes', []))
         node.links       = data.get('links', [])
         node.material    = data.get('material', 'Asphalt')
         return node
@@ -8,13 +8,15 @@ from PySide2.QtWidgets import (
     QGraphicsProxyWidget, QGraphicsRectItem, QGraphicsPolygonItem,
     QStyle, QSizePolicy, QToolTip,
 )
-from PySide2.QtCore import Qt, Signal, QPointF, QSize, QTimer, QRectF
+from PySide2.QtCore import (
+    Qt, Signal, Slot, QPointF, QSize, QTimer, QRectF, QSignalBlocker,
+)
 from PySide2.QtGui import (
     QPainter, QBrush, QColor, QPen, QPolygonF, QFont,
 )
 
 from .theme_dark import theme
-from .models.base import unpack_port, SCALAR_TYPES
+from .models.base import unpack_port, parse_codes, SCALAR_TYPES
 
 INPUT_COLOR        = theme.INPUT_PORT_COLOR
 OUTPUT_COLOR       = theme.OUTPUT_PORT_COLOR
@@ -35,6 +37,10 @@ EDITOR_STYLE_DISABLED = theme.EDITOR_STYLE_DISABLED
 COMBO_STYLE           = theme.COMBO_STYLE
 LABEL_STYLE           = theme.LABEL_STYLE
 
+# Shared numeric range / precision for inline spin-box editors
+EDITOR_LIMIT    = 1_000_000
+EDITOR_DECIMALS = 4
+
 # Decision node branch colors
 _YES_COLOR = QColor(60, 200, 100)    # green — true branch
 _NO_COLOR  = QColor(220, 80,  60)    # red   — false branch
@@ -70,6 +76,41 @@ def _format_port_value(value) -> str:
     return str(value)
 
 
+def _same_value(old, new) -> bool:
+    """Equality for editor values; floats compare within 1e-9."""
+    if isinstance(old, float) or isinstance(new, float):
+        try:
+            return abs(old - new) < 1e-9
+        except TypeError:
+            return False
+    return old == new
+
+
+def _set_spin_value(editor, value):
+    editor.setValue(value if value is not None else 0)
+
+
+def _set_text_value(editor, value):
+    if isinstance(value, list):
+        editor.setText(', '.join(str(v) for v in value))
+    else:
+        editor.setText(str(value) if value is not None else '')
+
+
+def _set_check_value(editor, value):
+    editor.setChecked(bool(value))
+
+
+# Scalar editor type → function that loads a value into that editor.
+_EDITOR_SETTERS = {
+    'float':   _set_spin_value,
+    'int':     _set_spin_value,
+    'percent': _set_spin_value,
+    'string':  _set_text_value,
+    'bool':    _set_check_value,
+}
+
+
 class PortDot(QWidget):
 
     def __init__(self, color: QColor, parent=None):
@@ -109,6 +150,7 @@ class ComboField(QWidget):
     def __init__(self, field_name, field_label, options, current_value=None, parent=None):
         super().__init__(parent)
         self.field_name = field_name
+        self._options   = None
 
         lay = QVBoxLayout()
         lay.setContentsMargins(4, 2, 4, 2)
@@ -119,17 +161,10 @@ class ComboField(QWidget):
         lbl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
         self._combo = QComboBox()
-        for opt in (options or []):
-            self._combo.addItem(opt['label'], opt['value'])
-        if current_value is not None:
-            idx = self._combo.findData(current_value)
-            if idx >= 0:
-                self._combo.setCurrentIndex(idx)
         self._combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self._combo.setStyleSheet(COMBO_STYLE)
-        self._combo.currentIndexChanged.connect(
-            lambda _: self.value_changed.emit(self.field_name, self._combo.currentData())
-        )
+        self.set_options(options, current_value)
+        self._combo.currentIndexChanged.connect(self._on_index_changed)
 
         lay.addWidget(lbl)
         lay.addWidget(self._combo)
@@ -138,6 +173,48 @@ class ComboField(QWidget):
         self.setStyleSheet("background: transparent;")
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
 
+    @Slot(int)
+    def _on_index_changed(self, _index):
+        self.value_changed.emit(self.field_name, self._combo.currentData())
+
+    def set_current_value(self, value):
+        """Select the option whose data equals *value* without emitting."""
+        idx = self._combo.findData(value)
+        if idx >= 0 and idx != self._combo.currentIndex():
+            blocker = QSignalBlocker(self._combo)
+            self._combo.setCurrentIndex(idx)
+            blocker.unblock()
+
+    def set_options(self, options, current_value=None):
+        """
+        Replace the combo contents in one batch.  Signals and repaints are
+        suspended while the items go in, so listeners see no intermediate
+        currentIndexChanged emissions.
+
+        Enum-backed option lists are shared per enum (see _enum_options),
+        so receiving the list already shown only moves the selection.
+        """
+        if options is not None and options is self._options:
+            self.set_current_value(current_value)
+            return
+        self._options = options
+        combo   = self._combo
+        blocker = QSignalBlocker(combo)
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            options = options or []
+            combo.addItems([opt['label'] for opt in options])
+            for i, opt in enumerate(options):
+                combo.setItemData(i, opt['value'])
+            if current_value is not None:
+                idx = combo.findData(current_value)
+                if idx >= 0:
+                    combo.setCurrentIndex(idx)
+        finally:
+            combo.setUpdatesEnabled(True)
+            blocker.unblock()
+
 
 class PortRow(QWidget):
     """
@@ -190,6 +267,7 @@ class PortRow(QWidget):
         self._label.setAttribute(Qt.WA_TransparentForMouseEvents)
 
         # Build the editor only when both type and flag allow it.
+        self._editor_type = editor_type
         self._editor = self._make_editor(editor_type, editor_value) if editor else None
 
         row = QHBoxLayout()
@@ -247,38 +325,43 @@ class PortRow(QWidget):
     # Editor factory
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _make_spin(spin_cls, decimals=None, suffix="", min_width=75):
+        """
+        Build a spin box with the shared inline-editor configuration.
+        Keyboard tracking is off so typing emits one valueChanged on commit
+        instead of one per keystroke.
+        """
+        w = spin_cls()
+        w.setRange(-EDITOR_LIMIT, EDITOR_LIMIT)
+        if decimals is not None:
+            w.setDecimals(decimals)
+        if suffix:
+            w.setSuffix(suffix)
+        w.setKeyboardTracking(False)
+        w.setMinimumWidth(min_width)
+        w.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        w.setStyleSheet(EDITOR_STYLE)
+        return w
+
     def _make_editor(self, etype, value):
         if etype == 'float':
-            w = QDoubleSpinBox()
-            w.setRange(-1e6, 1e6)
-            w.setDecimals(4)
+            w = self._make_spin(QDoubleSpinBox, decimals=EDITOR_DECIMALS)
             w.setValue(float(value) if value is not None else 0.0)
-            w.setMinimumWidth(75)
-            w.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            w.setStyleSheet(EDITOR_STYLE)
-            w.valueChanged.connect(lambda v: self.value_changed.emit(self.port_name, v))
+            w.valueChanged.connect(self._emit_value)
             return w
 
         if etype == 'int':
-            w = QSpinBox()
-            w.setRange(-1_000_000, 1_000_000)
+            w = self._make_spin(QSpinBox)
             w.setValue(int(value) if value is not None else 0)
-            w.setMinimumWidth(75)
-            w.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            w.setStyleSheet(EDITOR_STYLE)
-            w.valueChanged.connect(lambda v: self.value_changed.emit(self.port_name, v))
+            w.valueChanged.connect(self._emit_value)
             return w
 
         if etype == 'percent':
-            w = QDoubleSpinBox()
-            w.setRange(-1e6, 1e6)
-            w.setDecimals(4)
-            w.setSuffix(" %")
+            w = self._make_spin(QDoubleSpinBox, decimals=EDITOR_DECIMALS,
+                                suffix=" %", min_width=85)
             w.setValue(float(value) if value is not None else 0.0)
-            w.setMinimumWidth(85)
-            w.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            w.setStyleSheet(EDITOR_STYLE)
-            w.valueChanged.connect(lambda v: self.value_changed.emit(self.port_name, v))
+            w.valueChanged.connect(self._emit_value)
             return w
 
         if etype == 'string':
@@ -286,7 +369,7 @@ class PortRow(QWidget):
             w.setMinimumWidth(75)
             w.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             w.setStyleSheet(EDITOR_STYLE)
-            w.textChanged.connect(lambda v: self.value_changed.emit(self.port_name, v))
+            w.textChanged.connect(self._emit_value)
             return w
 
         if etype == 'bool':
@@ -294,11 +377,18 @@ class PortRow(QWidget):
             w.setChecked(bool(value) if value is not None else False)
             w.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
             w.setStyleSheet(theme.CHECKBOX_STYLE)
-            w.toggled.connect(lambda v: self.value_changed.emit(self.port_name, v))
+            w.toggled.connect(self._emit_value)
             return w
 
         return None
 
+    @Slot(float)
+    @Slot(int)
+    @Slot(str)
+    @Slot(bool)
+    def _emit_value(self, value):
+        self.value_changed.emit(self.port_name, value)
+
     def set_node_item(self, node_item):
         self.node_item_ref = node_item
 
@@ -308,10 +398,20 @@ class PortRow(QWidget):
             return
         style = EDITOR_STYLE_DISABLED if connected else EDITOR_STYLE
         self._editor.setStyleSheet(style)
-        if isinstance(self._editor, (QDoubleSpinBox, QSpinBox, QLineEdit)):
-            self._editor.setReadOnly(connected)
-        if isinstance(self._editor, QCheckBox):
+        if self._editor_type == 'bool':
             self._editor.setEnabled(not connected)
+        else:
+            self._editor.setReadOnly(connected)
+
+    def set_editor_value(self, value):
+        """Show *value* in the inline editor without emitting value_changed."""
+        if self._editor is None:
+            return
+        blocker = QSignalBlocker(self._editor)
+        try:
+            _EDITOR_SETTERS[self._editor_type](self._editor, value)
+        finally:
+            blocker.unblock()
 
     def dot_scene_pos(self) -> QPointF:
         if self.node_item_ref is None:
@@ -370,6 +470,9 @@ class PortRow(QWidget):
 
 class FlowchartNodeItem(QGraphicsRectItem):
 
+    # Header height used when the header widget reports no size hint
+    _HEADER_FALLBACK_H = 32
+
     def __init__(self, node, x, y, parent=None):
         super().__init__(0, 0, 10, 10, parent)
         self.node = node
@@ -381,6 +484,7 @@ class FlowchartNodeItem(QGraphicsRectItem):
         )
 
         self.ports: dict = {}
+        self.combo_fields: dict = {}
 
         self.container_widget = QWidget()
         self.container_widget.setAttribute(Qt.WA_TranslucentBackground)
@@ -406,6 +510,7 @@ class FlowchartNodeItem(QGraphicsRectItem):
 
         for pr in self.ports.values():
             pr.set_node_item(self)
+        self._built_layout_key = self._port_layout_key()
 
         self.update_size()
         self.setData(0, node)
@@ -423,22 +528,17 @@ class FlowchartNodeItem(QGraphicsRectItem):
         lay = QHBoxLayout()
         lay.setContentsMargins(8, 5, 8, 5)
 
-        self._header_label = QLabel(f"{self.node.type}  ·  {self.node.name}")
+        self._header_label = QLabel(self._header_text(self.node.name))
         self._header_label.setStyleSheet(theme.HEADER_LABEL_STYLE)
         self._header_label.setAlignment(Qt.AlignCenter)
         self._header_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self._header_label.mouseDoubleClickEvent = lambda e: self.edit_name()
+        self._header_label.mouseDoubleClickEvent = self._on_header_double_click
 
-        self._name_edit = QLineEdit(self.node.name)
-        self._name_edit.setAlignment(Qt.AlignCenter)
-        self._name_edit.setStyleSheet(theme.NAME_EDIT_STYLE)
-        self._name_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self._name_edit.hide()
-        self._name_edit.returnPressed.connect(self._finish_rename)
-        self._name_edit.editingFinished.connect(self._finish_rename)
+        # The rename editor is built on first use by _ensure_name_edit().
+        self._name_edit     = None
+        self._header_layout = lay
 
         lay.addWidget(self._header_label)
-        lay.addWidget(self._name_edit)
         w.setLayout(lay)
         return w
 
@@ -462,8 +562,14 @@ class FlowchartNodeItem(QGraphicsRectItem):
         w.setLayout(lay)
         return w, lay
 
-    def _populate_port_rows(self, layout):
+    def _populate_port_rows(self, layout, reuse=None):
+        # *reuse* carries the rows and combo fields of the previous layout;
+        # any whose shape still matches is moved into the new layout and
+        # only has its value refreshed.
+        reuse_rows   = reuse[0] if reuse else {}
+        reuse_combos = reuse[1] if reuse else {}
         self.ports.clear()
+        self.combo_fields.clear()
 
         inputs  = self.node.get_input_ports()
         outputs = self.node.get_output_ports()
@@ -495,8 +601,13 @@ class FlowchartNodeItem(QGraphicsRectItem):
                         else port_def)
                 lbl  = name.replace('_', ' ').title()
                 val  = getattr(self.node, name, None)
-                cf   = ComboField(name, lbl, opts, val)
-                cf.value_changed.connect(self._on_value_changed)
+                cf   = reuse_combos.pop(name, None)
+                if cf is not None:
+                    cf.set_options(opts, val)
+                else:
+                    cf = ComboField(name, lbl, opts, val)
+                    cf.value_changed.connect(self._on_value_changed)
+                self.combo_fields[name] = cf
                 cslay.addWidget(cf)
             combo_section.setLayout(cslay)
             layout.addWidget(combo_section)
@@ -522,6 +633,14 @@ class FlowchartNodeItem(QGraphicsRectItem):
             if port_name in ('point_codes', 'link_codes') and isinstance(eval_, list):
                 eval_ = ', '.join(eval_)
 
+            editor_type = ptype if ptype in SCALAR_TYPES else None
+            pr = reuse_rows.pop(
+                (port_name, direction, editor_type, bool(show_editor)), None)
+            if pr is not None:
+                pr.set_editor_value(eval_)
+                self.ports[port_name] = pr
+                return pr
+
             lbl = ('Slope (%)' if port_name == 'slope'
                    else port_name.replace('_', ' ').title())
 
@@ -529,7 +648,7 @@ class FlowchartNodeItem(QGraphicsRectItem):
                 port_name    = port_name,
                 port_label   = lbl,
                 direction    = direction,
-                editor_type  = ptype if ptype in SCALAR_TYPES else None,
+                editor_type  = editor_type,
                 editor_value = eval_,
                 editor       = show_editor,
                 node_item_ref= None,
@@ -602,8 +721,41 @@ class FlowchartNodeItem(QGraphicsRectItem):
     # Rebuild ports after structural change
     # ------------------------------------------------------------------
 
+    def _port_layout_key(self):
+        """Hashable summary of the port names and editor kinds on the node."""
+        def kind(port_def):
+            ptype, editor = unpack_port(port_def)
+            return ('combo' if isinstance(ptype, list) else ptype), editor
+
+        node = self.node
+        return (
+            tuple((n, kind(d)) for n, d in node.get_input_ports().items()),
+            tuple((n, kind(d)) for n, d in node.get_output_ports().items()),
+        )
+
     def rebuild_ports(self):
-        self._body_widget.blockSignals(True)
+        # A structural value change often leaves the port set untouched
+        # (e.g. data_type on a parameter node); then only the combo
+        # selections need to follow the model.
+        key = self._port_layout_key()
+        if key == self._built_layout_key:
+            for name, cf in self.combo_fields.items():
+                cf.set_current_value(getattr(self.node, name, None))
+            return
+
+        # Silence the outgoing rows: an editor that loses focus while being
+        # torn down would otherwise commit a stale value to the node.
+        blockers = [QSignalBlocker(w) for w in (
+            self._body_widget, *self.ports.values(), *self.combo_fields.values(),
+        )]
+        reuse = (
+            {(pr.port_name, pr.direction, pr._editor_type, pr._editor is not None): pr
+             for pr in self.ports.values()},
+            dict(self.combo_fields),
+        )
+
+        # Paint the body once, after the new rows are in place.
+        self._body_widget.setUpdatesEnabled(False)
 
         lay = self._body_layout
         widgets_to_remove = []
@@ -616,14 +768,18 @@ class FlowchartNodeItem(QGraphicsRectItem):
             w.hide()
             w.setParent(None)
 
-        self.ports.clear()
-        self._populate_port_rows(lay)
+        # The old containers stay referenced until the new layout has
+        # adopted the reused rows, so those rows are not deleted with them.
+        self._populate_port_rows(lay, reuse)
         lay.addStretch(0)
 
         for pr in self.ports.values():
             pr.set_node_item(self)
+        self._built_layout_key = key
 
-        self._body_widget.blockSignals(False)
+        for blocker in blockers:
+            blocker.unblock()
+        self._body_widget.setUpdatesEnabled(True)
         self.update_size()
 
     def get_port_scene_pos(self, port_name):
@@ -649,8 +805,7 @@ class FlowchartNodeItem(QGraphicsRectItem):
         else:
             old_value = getattr(node, port_name, None)
 
-        if old_value == value:
-            self._apply_value(port_name, value)
+        if _same_value(old_value, value):
             return
 
         sc = self.scene()
@@ -667,18 +822,15 @@ class FlowchartNodeItem(QGraphicsRectItem):
         node = self.node
 
         if port_name in ('point_codes', 'link_codes') and isinstance(value, str):
-            codes_list = [code.strip() for code in value.split(',') if code.strip()]
-            setattr(node, port_name, codes_list)
+            setattr(node, port_name, parse_codes(value))
         else:
             if hasattr(node, port_name):
                 setattr(node, port_name, value)
 
         if port_name in ('rise', 'run') and hasattr(node, 'percent'):
             percent_row = self.ports.get('percent')
-            if percent_row and percent_row._editor is not None:
-                percent_row._editor.blockSignals(True)
-                percent_row._editor.setValue(node.percent)
-                percent_row._editor.blockSignals(False)
+            if percent_row:
+                percent_row.set_editor_value(node.percent)
 
         structural_ports = ('geometry_type', 'link_type', 'target_type', 'data_type')
         if port_name in structural_ports:
@@ -692,18 +844,50 @@ class FlowchartNodeItem(QGraphicsRectItem):
     # Rename
     # ------------------------------------------------------------------
 
+    def _ensure_name_edit(self):
+        """Create the rename line edit the first time it is needed."""
+        if self._name_edit is None:
+            edit = QLineEdit(self.node.name)
+            edit.setAlignment(Qt.AlignCenter)
+            edit.setStyleSheet(theme.NAME_EDIT_STYLE)
+            edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+            edit.hide()
+            # editingFinished also fires on Return; listening to
+            # returnPressed as well would commit every rename twice.
+            edit.editingFinished.connect(self._finish_rename)
+            self._header_layout.addWidget(edit)
+            self._name_edit = edit
+        return self._name_edit
+
+    def _header_text(self, name):
+        return f"{self.node.type}  ·  {name}"
+
+    def _on_header_double_click(self, _event):
+        self.edit_name()
+
     def edit_name(self):
         self._pending_rename_old = self.node.name
+        self._ensure_name_edit()
         self._header_label.hide()
+        blocker = QSignalBlocker(self._name_edit)
         self._name_edit.setText(self.node.name)
+        blocker.unblock()
         self._name_edit.show()
+        # The line edit's size hint differs from the label's; re-measure so
+        # paint() draws the header band at the editor's height.
+        self.update_size()
         self._name_edit.setFocus()
         self._name_edit.selectAll()
 
     def _finish_rename(self):
         new_name = self._name_edit.text().strip()
+        # Hiding drops focus, which would emit editingFinished again and
+        # re-enter this method before the first rename is recorded.
+        blocker = QSignalBlocker(self._name_edit)
         self._name_edit.hide()
+        blocker.unblock()
         self._header_label.show()
+        self.update_size()
 
         if not new_name:
             return
@@ -717,14 +901,13 @@ class FlowchartNodeItem(QGraphicsRectItem):
             from .undo_stack import RenameNodeCommand
             cmd = RenameNodeCommand(sc, self, old_name, new_name)
             self.node.name = new_name
-            self._header_label.setText(f"{self.node.type}  ·  {new_name}")
+            self._header_label.setText(self._header_text(new_name))
             sc.undo_stack._stack = sc.undo_stack._stack[:sc.undo_stack._index + 1]
             sc.undo_stack._stack.append(cmd)
             sc.undo_stack._index = len(sc.undo_stack._stack) - 1
-            sc.request_preview_update()
         else:
             self.node.name = new_name
-            self._header_label.setText(f"{self.node.type}  ·  {new_name}")
+            self._header_label.setText(self._header_text(new_name))
 
         self.update_size()
         if self.scene():
@@ -734,10 +917,19 @@ class FlowchartNodeItem(QGraphicsRectItem):
     # Size / paint
     # ------------------------------------------------------------------
 
+    def _cache_header_height(self):
+        """
+        Measure the header once per layout change so paint() does not
+        query sizeHint() (a layout pass) on every repaint.
+        """
+        hh = self._header_widget.sizeHint().height()
+        self._header_h = hh if hh > 0 else self._HEADER_FALLBACK_H
+
     def update_size(self):
         lay = self.container_widget.layout()
         if lay:
             lay.activate()
+        self._cache_header_height()
 
         msh = self.container_widget.minimumSizeHint()
         sh  = self.container_widget.sizeHint()
@@ -770,10 +962,7 @@ class FlowchartNodeItem(QGraphicsRectItem):
 
         rect = self.rect()
         sel  = self.isSelected()
-
-        hh = self._header_widget.sizeHint().height()
-        if hh <= 0:
-            hh = 32
+        hh   = self._header_h
 
         if not sel:
             painter.setPen(Qt.NoPen)
@@ -833,6 +1022,7 @@ class DecisionNodeItem(FlowchartNodeItem):
 
     # Extra pixels the diamond tip protrudes above the widget rect
     _DIAMOND_OVERHANG = 14
+    _HEADER_FALLBACK_H = 36
 
     def __init__(self, node, x, y, parent=None):
         # We need the overhang space so shift the proxy widget down.
@@ -846,6 +1036,9 @@ class DecisionNodeItem(FlowchartNodeItem):
     # directly in paint().  We keep the widget for the name label only.
     # ------------------------------------------------------------------
 
+    def _header_text(self, name):
+        return f"IF  ·  {name}"
+
     def _build_header(self):
         """
         Build a slim header widget that contains only the name label and
@@ -860,25 +1053,20 @@ class DecisionNodeItem(FlowchartNodeItem):
         # Top margin = diamond overhang so text sits below the diamond tip
         lay.setContentsMargins(8, self._DIAMOND_OVERHANG + 2, 8, 4)
 
-        self._header_label = QLabel(f"IF  ·  {self.node.name}")
+        self._header_label = QLabel(self._header_text(self.node.name))
         self._header_label.setStyleSheet(
             "QLabel { color: #e8d870; font-weight: bold; "
             "font-size: 9pt; background: transparent; }"
         )
         self._header_label.setAlignment(Qt.AlignCenter)
         self._header_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self._header_label.mouseDoubleClickEvent = lambda e: self.edit_name()
+        self._header_label.mouseDoubleClickEvent = self._on_header_double_click
 
-        self._name_edit = QLineEdit(self.node.name)
-        self._name_edit.setAlignment(Qt.AlignCenter)
-        self._name_edit.setStyleSheet(theme.NAME_EDIT_STYLE)
-        self._name_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self._name_edit.hide()
-        self._name_edit.returnPressed.connect(self._finish_rename)
-        self._name_edit.editingFinished.connect(self._finish_rename)
+        # The rename editor is built on first use by _ensure_name_edit().
+        self._name_edit     = None
+        self._header_layout = lay
 
         lay.addWidget(self._header_label)
-        lay.addWidget(self._name_edit)
         w.setLayout(lay)
         return w
 
@@ -886,7 +1074,7 @@ class DecisionNodeItem(FlowchartNodeItem):
     # Override body: add coloured yes/no port rows + live branch badge
     # ------------------------------------------------------------------
 
-    def _populate_port_rows(self, layout):
+    def _populate_port_rows(self, layout, reuse=None):
         """
         Custom port layout for Decision node:
 
@@ -1013,6 +1201,7 @@ class DecisionNodeItem(FlowchartNodeItem):
         lay = self.container_widget.layout()
         if lay:
             lay.activate()
+        self._cache_header_height()
 
         msh = self.container_widget.minimumSizeHint()
         sh  = self.container_widget.sizeHint()
@@ -1034,36 +1223,6 @@ class DecisionNodeItem(FlowchartNodeItem):
     # Override rename helpers to use "IF · name" format
     # ------------------------------------------------------------------
 
-    def _finish_rename(self):
-        new_name = self._name_edit.text().strip()
-        self._name_edit.hide()
-        self._header_label.show()
-
-        if not new_name:
-            return
-
-        old_name = getattr(self, '_pending_rename_old', self.node.name)
-        if new_name == old_name:
-            return
-
-        sc = self.scene()
-        if sc and hasattr(sc, 'undo_stack'):
-            from .undo_stack import RenameNodeCommand
-            cmd = RenameNodeCommand(sc, self, old_name, new_name)
-            self.node.name = new_name
-            self._header_label.setText(f"IF  ·  {new_name}")
-            sc.undo_stack._stack = sc.undo_stack._stack[:sc.undo_stack._index + 1]
-            sc.undo_stack._stack.append(cmd)
-            sc.undo_stack._index = len(sc.undo_stack._stack) - 1
-            sc.request_preview_update()
-        else:
-            self.node.name = new_name
-            self._header_label.setText(f"IF  ·  {new_name}")
-
-        self.update_size()
-        if self.scene():
-            self.scene().request_preview_update()
-
     # ------------------------------------------------------------------
     # Paint — diamond header + standard body
     # ------------------------------------------------------------------
@@ -1078,9 +1237,7 @@ class DecisionNodeItem(FlowchartNodeItem):
         oh   = self._DIAMOND_OVERHANG   # diamond overhang above the body
 
         # Body top starts at oh; header height is the label widget height
-        hh = self._header_widget.sizeHint().height()
-        if hh <= 0:
-            hh = 36
+        hh = self._header_h
         body_top = oh
 
         # ── Drop shadow ────────────────────────────────────────────────
@@ -24,6 +24,7 @@ import base64
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 
 from PySide2.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QSplitter,
@@ -34,7 +35,7 @@ from PySide2.QtWidgets import (
 )
 from PySide2.QtCore import (
     Qt, QSize, QDir, QSortFilterProxyModel,
-    QModelIndex, QFileInfo,
+    QModelIndex, QFileInfo, Slot,
 )
 from PySide2.QtGui import QPixmap, QColor, QPainter, QFont, QIcon
 
@@ -55,23 +56,30 @@ def _load_cdj_meta(path: str) -> dict:
         result['thumbnail'] = data.get('thumbnail')
         result['n_nodes']   = len(data.get('nodes', []))
         result['n_conns']   = len(data.get('connections', []))
-    except Exception:
+    except (OSError, ValueError, AttributeError, TypeError):
+        # Unreadable file, malformed JSON or an unexpected document shape.
         pass
     return result
 
 
 def _pixmap_from_b64(b64_uri: str, w: int, h: int):
+    if not isinstance(b64_uri, str) or ',' not in b64_uri:
+        return None
     try:
         raw = base64.b64decode(b64_uri.split(',', 1)[1])
-        pix = QPixmap()
-        pix.loadFromData(raw)
-        if pix.isNull():
-            return None
-        return pix.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-    except Exception:
+    except ValueError:          # binascii.Error: corrupt payload
+        return None
+    pix = QPixmap()
+    pix.loadFromData(raw)
+    if pix.isNull():
         return None
+    return pix.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
 
+# Rendered on first use only: the panel shows it on every clear and for
+# every file without a thumbnail.  QPixmap is implicitly shared, so handing
+# the same instance to setPixmap is safe.
+@lru_cache(maxsize=None)
 def _placeholder_pixmap(w: int, h: int) -> QPixmap:
     pix = QPixmap(w, h)
     pix.fill(QColor(28, 30, 38))
@@ -451,6 +459,7 @@ class OpenComponentDialog(QDialog):
         self._back_btn.setEnabled(self._hist_idx > 0)
         self._fwd_btn.setEnabled(self._hist_idx < len(self._history) - 1)
 
+    @Slot()
     def _go_back(self):
         if self._hist_idx > 0:
             self._hist_idx -= 1
@@ -458,6 +467,7 @@ class OpenComponentDialog(QDialog):
             self._back_btn.setEnabled(self._hist_idx > 0)
             self._fwd_btn.setEnabled(True)
 
+    @Slot()
     def _go_fwd(self):
         if self._hist_idx < len(self._history) - 1:
             self._hist_idx += 1
@@ -465,6 +475,7 @@ class OpenComponentDialog(QDialog):
             self._back_btn.setEnabled(True)
             self._fwd_btn.setEnabled(self._hist_idx < len(self._history) - 1)
 
+    @Slot()
     def _on_addr_enter(self):
         path = self._addr.text().strip()
         if os.path.isdir(path):
@@ -477,6 +488,7 @@ class OpenComponentDialog(QDialog):
     # Tree click → navigate
     # ------------------------------------------------------------------
 
+    @Slot(QModelIndex)
     def _on_tree_clicked(self, proxy_idx: QModelIndex):
         src_idx = self._dir_proxy.mapToSource(proxy_idx)
         finfo   = self._fs.fileInfo(src_idx)
@@ -487,6 +499,7 @@ class OpenComponentDialog(QDialog):
     # File list selection
     # ------------------------------------------------------------------
 
+    @Slot(QModelIndex, QModelIndex)
     def _on_file_selection_changed(self, current: QModelIndex, _prev):
         src_idx = self._file_proxy.mapToSource(current)
         finfo   = self._fs.fileInfo(src_idx)
@@ -510,6 +523,7 @@ class OpenComponentDialog(QDialog):
             self._open_btn.setEnabled(False)
             self._preview.clear()
 
+    @Slot(QModelIndex)
     def _on_file_double_clicked(self, proxy_idx: QModelIndex):
         src_idx = self._file_proxy.mapToSource(proxy_idx)
         finfo   = self._fs.fileInfo(src_idx)
@@ -524,6 +538,7 @@ class OpenComponentDialog(QDialog):
     # Accept
     # ------------------------------------------------------------------
 
+    @Slot()
     def _try_accept(self):
         # If a .cdj file is selected, open it
         if self._selected_path and os.path.isfile(self._selected_path):
@@ -3,7 +3,7 @@ Toolbox Panel for Component Designer
 """
 from PySide2.QtWidgets import (QWidget, QVBoxLayout, QApplication,
                                QTreeWidget, QTreeWidgetItem)
-from PySide2.QtCore import Qt, Signal, QMimeData
+from PySide2.QtCore import Qt, Signal, Slot, QMimeData, QSignalBlocker
 from PySide2.QtGui import QDrag, QPainter, QPixmap, QPen, QColor
 
 from .theme_dark import theme
@@ -11,6 +11,9 @@ from .theme_dark import theme
 
 class DraggableTreeWidget(QTreeWidget):
 
+    # element_type → rendered drag pixmap, shared by every toolbox tree
+    _pixmap_cache: dict = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setDragEnabled(True)
@@ -22,11 +25,11 @@ class DraggableTreeWidget(QTreeWidget):
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        if not (event.buttons() & Qt.LeftButton):
-            return
-        if self._drag_start_pos is None:
+        # Cheapest test first: most moves arrive with no press pending.
+        start = self._drag_start_pos
+        if start is None or not (event.buttons() & Qt.LeftButton):
             return
-        if ((event.pos() - self._drag_start_pos).manhattanLength()
+        if ((event.pos() - start).manhattanLength()
                 < QApplication.startDragDistance()):
             return
 
@@ -39,6 +42,27 @@ class DraggableTreeWidget(QTreeWidget):
         mime = QMimeData()
         mime.setText(element_type)
 
+        pixmap = self._drag_pixmap(element_type)
+
+        drag = QDrag(self)
+        drag.setMimeData(mime)
+        drag.setPixmap(pixmap)
+        drag.setHotSpot(pixmap.rect().center())
+        # One drag per press; later moves bail out at the first test.
+        self._drag_start_pos = None
+        drag.exec_(Qt.CopyAction)
+
+    @classmethod
+    def _drag_pixmap(cls, element_type: str) -> QPixmap:
+        """Return the drag pixmap for *element_type*, rendering it only once."""
+        pixmap = cls._pixmap_cache.get(element_type)
+        if pixmap is None:
+            pixmap = cls._render_drag_pixmap(element_type)
+            cls._pixmap_cache[element_type] = pixmap
+        return pixmap
+
+    @staticmethod
+    def _render_drag_pixmap(element_type: str) -> QPixmap:
         pixmap = QPixmap(140, 36)
         pixmap.fill(QColor(38, 45, 65, 230))
         painter = QPainter(pixmap)
@@ -47,17 +71,22 @@ class DraggableTreeWidget(QTreeWidget):
         painter.setPen(QColor(200, 210, 230))
         painter.drawText(pixmap.rect(), Qt.AlignCenter, element_type)
         painter.end()
-
-        drag = QDrag(self)
-        drag.setMimeData(mime)
-        drag.setPixmap(pixmap)
-        drag.setHotSpot(pixmap.rect().center())
-        drag.exec_(Qt.CopyAction)
+        return pixmap
 
 
 # Node types handled by the new specialised target creators
 _TARGET_TYPES = ("Surface Target", "Elevation Target", "Offset Target")
 
+_TYPED_INPUTS = (
+    "Integer Input",
+    "Double Input",
+    "String Input",
+    "Grade Input",
+    "Slope Input",
+    "Yes\\No Input",
+    "Superelevation Input",
+)
+
 # Math node labels grouped by sub-category for toolbox display
 _MATH_ARITHMETIC   = ("Add", "Subtract", "Multiply", "Divide", "Modulo", "Power")
 _MATH_UNARY        = ("Abs", "Negate", "Sqrt", "Ceil", "Floor", "Round")
@@ -72,6 +101,28 @@ _LOGIC_COMPARISON  = ("Equal", "Not Equal", "Greater", "Greater Equal",
                       "Less", "Less Equal")
 _LOGIC_UTILITY     = ("If Else", "Switch", "All", "Any")
 
+_GEOMETRY  = ("Point", "Link", "Shape")
+_AUXILIARY = ("Auxiliary Point", "Auxiliary Line", "Auxiliary Curve")
+_WORKFLOW  = ("Decision", "Switch", "Variable")
+
+
+def _leaves(labels):
+    """Draggable leaf items for *labels*."""
+    items = []
+    for label in labels:
+        item = QTreeWidgetItem([label])
+        item.setFlags(item.flags() | Qt.ItemIsDragEnabled)
+        items.append(item)
+    return items
+
+
+def _group(title, children):
+    """Non-draggable category item holding *children*, added in one call."""
+    grp = QTreeWidgetItem([title])
+    grp.setFlags(grp.flags() & ~Qt.ItemIsDragEnabled)
+    grp.addChildren(children)
+    return grp
+
 
 class ToolboxPanel(QWidget):
 
@@ -88,109 +139,47 @@ class ToolboxPanel(QWidget):
         self.tree = DraggableTreeWidget()
         self.tree.setHeaderLabel("Toolbox")
         self.tree.setIndentation(16)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setAnimated(False)
         self.tree.setStyleSheet(theme.TOOLBOX_STYLE)
         self.setStyleSheet("background: #161820;")
 
-        # ── Parameters ──────────────────────────────────────────────────────
-        params = QTreeWidgetItem(["Parameters"])
-        params.setFlags(params.flags() & ~Qt.ItemIsDragEnabled)
-        for label in ("Output",):
-            child = QTreeWidgetItem([label])
-            child.setFlags(child.flags() | Qt.ItemIsDragEnabled)
-            params.addChild(child)
-        self.tree.addTopLevelItem(params)
-
-        # ── Targets ─────────────────────────────────────────────────────────
-        targets = QTreeWidgetItem(["Targets"])
-        targets.setFlags(targets.flags() & ~Qt.ItemIsDragEnabled)
-        for label in _TARGET_TYPES:
-            child = QTreeWidgetItem([label])
-            child.setFlags(child.flags() | Qt.ItemIsDragEnabled)
-            targets.addChild(child)
-        self.tree.addTopLevelItem(targets)
-
-        # ── Typed Inputs ────────────────────────────────────────────────────
-        typed = QTreeWidgetItem(["Typed Inputs"])
-        typed.setFlags(typed.flags() & ~Qt.ItemIsDragEnabled)
-        for label in (
-            "Integer Input",
-            "Double Input",
-            "String Input",
-            "Grade Input",
-            "Slope Input",
-            "Yes\\No Input",
-            "Superelevation Input",
-        ):
-            child = QTreeWidgetItem([label])
-            child.setFlags(child.flags() | Qt.ItemIsDragEnabled)
-            typed.addChild(child)
-        self.tree.addTopLevelItem(typed)
-
-        # ── Math ─────────────────────────────────────────────────────────────
-        math_root = QTreeWidgetItem(["Math"])
-        math_root.setFlags(math_root.flags() & ~Qt.ItemIsDragEnabled)
-
-        def _add_subgroup(parent, title, labels):
-            grp = QTreeWidgetItem([title])
-            grp.setFlags(grp.flags() & ~Qt.ItemIsDragEnabled)
-            for lbl in labels:
-                ch = QTreeWidgetItem([lbl])
-                ch.setFlags(ch.flags() | Qt.ItemIsDragEnabled)
-                grp.addChild(ch)
-            parent.addChild(grp)
-
-        _add_subgroup(math_root, "Arithmetic",   _MATH_ARITHMETIC)
-        _add_subgroup(math_root, "Unary",        _MATH_UNARY)
-        _add_subgroup(math_root, "Trigonometry", _MATH_TRIG)
-        _add_subgroup(math_root, "Logarithm",    _MATH_LOG)
-        _add_subgroup(math_root, "Comparison",   _MATH_COMPARISON)
-        _add_subgroup(math_root, "Utility",      _MATH_UTILITY)
-
-        self.tree.addTopLevelItem(math_root)
-
-        # ── Logic ────────────────────────────────────────────────────────────
-        logic_root = QTreeWidgetItem(["Logic"])
-        logic_root.setFlags(logic_root.flags() & ~Qt.ItemIsDragEnabled)
-
-        _add_subgroup(logic_root, "Boolean",    _LOGIC_BOOLEAN)
-        _add_subgroup(logic_root, "Comparison", _LOGIC_COMPARISON)
-        _add_subgroup(logic_root, "Utility",    _LOGIC_UTILITY)
-
-        self.tree.addTopLevelItem(logic_root)
-
-        # ── Geometry ────────────────────────────────────────────────────────
-        geometry = QTreeWidgetItem(["Geometry"])
-        geometry.setFlags(geometry.flags() & ~Qt.ItemIsDragEnabled)
-        for label in ("Point", "Link", "Shape"):
-            child = QTreeWidgetItem([label])
-            child.setFlags(child.flags() | Qt.ItemIsDragEnabled)
-            geometry.addChild(child)
-        self.tree.addTopLevelItem(geometry)
-
-        # ── Auxiliary ───────────────────────────────────────────────────────
-        auxiliary = QTreeWidgetItem(["Auxiliary"])
-        auxiliary.setFlags(auxiliary.flags() & ~Qt.ItemIsDragEnabled)
-        for label in ("Auxiliary Point", "Auxiliary Line", "Auxiliary Curve"):
-            child = QTreeWidgetItem([label])
-            child.setFlags(child.flags() | Qt.ItemIsDragEnabled)
-            auxiliary.addChild(child)
-        self.tree.addTopLevelItem(auxiliary)
-
-        # ── Workflow ────────────────────────────────────────────────────────
-        workflow = QTreeWidgetItem(["Workflow"])
-        workflow.setFlags(workflow.flags() & ~Qt.ItemIsDragEnabled)
-        for label in ("Decision", "Switch", "Variable"):
-            child = QTreeWidgetItem([label])
-            child.setFlags(child.flags() | Qt.ItemIsDragEnabled)
-            workflow.addChild(child)
-        self.tree.addTopLevelItem(workflow)
-
+        # Build every category detached from the tree, then insert them all
+        # at once so the view lays out a single time.  Nothing listens yet,
+        # so the per-item expanded/changed notifications are suppressed too.
+        blocker = QSignalBlocker(self.tree)
+        self.tree.setUpdatesEnabled(False)
+        self.tree.addTopLevelItems([
+            _group("Parameters",   _leaves(("Output",))),
+            _group("Targets",      _leaves(_TARGET_TYPES)),
+            _group("Typed Inputs", _leaves(_TYPED_INPUTS)),
+            _group("Math", [
+                _group("Arithmetic",   _leaves(_MATH_ARITHMETIC)),
+                _group("Unary",        _leaves(_MATH_UNARY)),
+                _group("Trigonometry", _leaves(_MATH_TRIG)),
+                _group("Logarithm",    _leaves(_MATH_LOG)),
+                _group("Comparison",   _leaves(_MATH_COMPARISON)),
+                _group("Utility",      _leaves(_MATH_UTILITY)),
+            ]),
+            _group("Logic", [
+                _group("Boolean",    _leaves(_LOGIC_BOOLEAN)),
+                _group("Comparison", _leaves(_LOGIC_COMPARISON)),
+                _group("Utility",    _leaves(_LOGIC_UTILITY)),
+            ]),
+            _group("Geometry",  _leaves(_GEOMETRY)),
+            _group("Auxiliary", _leaves(_AUXILIARY)),
+            _group("Workflow",  _leaves(_WORKFLOW)),
+        ])
         self.tree.expandAll()
+        self.tree.setUpdatesEnabled(True)
+        blocker.unblock()
+
         self.tree.itemDoubleClicked.connect(self._on_double_click)
 
         layout.addWidget(self.tree)
         self.setLayout(layout)
 
+    @Slot(QTreeWidgetItem, int)
     def _on_double_click(self, item, _column):
         if item.childCount() == 0:
             self.element_selected.emit(item.text(0))
@@ -15,20 +15,24 @@ wire resolver stamps on them.
 """
 
 import traceback
-from collections import deque
+from functools import lru_cache
+from collections import defaultdict, deque
 
 from PySide2.QtWidgets import (
     QGraphicsView, QGraphicsScene,
     QGraphicsEllipseItem, QGraphicsLineItem,
-    QGraphicsPolygonItem, QGraphicsItem, QGraphicsTextItem,
+    QGraphicsItem, QGraphicsTextItem,
 )
 from PySide2.QtCore  import Qt, QPointF, QRectF, Signal
 from PySide2.QtGui   import (
     QPainter, QBrush, QColor, QPen, QFont, QPolygonF, QFontMetrics,
+    QTransform,
 )
 
 from .models import PointNode, LinkNode
 from .models.workflow import DecisionNode
+from .models.targets import (SurfaceTargetNode, ElevationTargetNode,
+                             OffsetTargetNode)
 from .base_graphics_view import BaseGraphicsView
 from .theme_dark import theme
 
@@ -41,6 +45,7 @@ _AXIS_PEN_COLOR  = theme.AXIS_COLOR
 _AXIS_PEN_WIDTH  = 1.5
 _SURFACE_COLOR   = theme.SURFACE_COLOR
 _SURFACE_DASH    = [10, 6]
+_LINK_DASH       = [4, 4]
 _ELEV_COLOR      = theme.ELEVATION_COLOR
 _OFFSET_COLOR    = theme.OFFSET_COLOR
 _ARROW_HEAD      = 10
@@ -48,12 +53,57 @@ _ARROW_SHAFT     = 28
 _LABEL_PAD       = 6
 _EDGE_MARGIN     = 6
 
+# Input port → attribute _stamp_wire_ids sets to the upstream node id
+_WIRE_ID_ATTRS = {
+    'reference': '_wire_ref_id',
+    'start':     '_wire_start_id',
+    'end':       '_wire_end_id',
+}
+
+# Flowchart-canvas placement; dragging a node changes these on every step
+# but no preview builder reads them, so they stay out of the signature.
+_CANVAS_ATTRS = frozenset(('x', 'y'))
+
+# Target node class → overlay type drawn by GeometryPreview.drawForeground
+_OVERLAY_TYPES = {
+    SurfaceTargetNode:   'surface',
+    ElevationTargetNode: 'elevation',
+    OffsetTargetNode:    'offset',
+}
+
+
+@lru_cache(maxsize=None)
+def _overlay_type(cls):
+    """
+    Overlay type for node class *cls*, or None.  Walks the MRO so target
+    subclasses classify like their base, as isinstance() would; the result
+    is memoised per class.
+    """
+    for base in cls.__mro__:
+        overlay = _OVERLAY_TYPES.get(base)
+        if overlay is not None:
+            return overlay
+    return None
+
 
 class PreviewTextItem(QGraphicsTextItem):
 
+    # (point size, bold) → QFont shared by every label of that style
+    _fonts: dict = {}
+
+    @classmethod
+    def _font(cls, size, bold):
+        font = cls._fonts.get((size, bold))
+        if font is None:
+            font = QFont()
+            font.setPointSizeF(size)
+            font.setBold(bold)
+            cls._fonts[(size, bold)] = font
+        return font
+
     def __init__(self, text, node,
                  anchor_scene=None, offset_screen=None,
-                 base_font_size=BASE_FONT_NODE_LABEL, parent=None):
+                 base_font_size=BASE_FONT_NODE_LABEL, bold=False, parent=None):
         super().__init__(text, parent)
         self.node           = node
         self.anchor_scene   = anchor_scene  or QPointF(0, 0)
@@ -61,29 +111,20 @@ class PreviewTextItem(QGraphicsTextItem):
         self.base_font_size = base_font_size
 
         self.setFlags(QGraphicsItem.ItemIsSelectable)
-        self.setData(0, node)
         self.normal_color   = self.defaultTextColor()
         self.selected_color = theme.POINT_SEL_PEN
 
-        f = QFont()
-        f.setPointSizeF(base_font_size)
-        self.setFont(f)
-        self.setPos(self.anchor_scene + self.offset_screen)
-
-    def apply_scale(self, view_scale: float):
-        f = self.font()
-        f.setPointSizeF(max(1.0, self.base_font_size / view_scale))
-        self.setFont(f)
-        scene_offset = QPointF(
-            self.offset_screen.x() / view_scale,
-            self.offset_screen.y() / view_scale,
-        )
-        self.setPos(self.anchor_scene + scene_offset)
-
-    def mousePressEvent(self, event):
-        super().mousePressEvent(event)
-        if self.scene():
-            self.scene().node_clicked.emit(self.node)
+        # Labels keep a constant on-screen size: Qt skips the view transform
+        # for this item, so the font and the pixel offset from the anchor
+        # are set once and zooming needs no per-label work.
+        self.setFlag(QGraphicsItem.ItemIgnoresTransformations, True)
+        self.setFont(self._font(base_font_size, bold))
+        self.setPos(self.anchor_scene)
+        self.setTransform(QTransform.fromTranslate(
+            self.offset_screen.x(), self.offset_screen.y()))
+        # Text layout is the costliest paint in the preview; keep the
+        # rendered label as a pixmap so pans and zooms only blit it.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
     def set_selected_style(self, selected: bool):
         if selected:
@@ -96,22 +137,27 @@ class PreviewTextItem(QGraphicsTextItem):
 
 class PreviewPointItem(QGraphicsEllipseItem):
 
+    # Pens and brushes are identical for every instance; built on first use.
+    normal_pen = normal_brush = selected_pen = selected_brush = None
+
+    @classmethod
+    def _ensure_pens(cls):
+        if cls.normal_pen is None:
+            cls.normal_pen     = QPen(theme.POINT_NORMAL_PEN, 1)
+            cls.normal_brush   = QBrush(theme.POINT_NORMAL_FILL)
+            cls.selected_pen   = QPen(theme.POINT_SEL_PEN, 3)
+            cls.selected_brush = QBrush(theme.POINT_SEL_FILL)
+
     def __init__(self, x, y, node, parent=None):
         super().__init__(x - 4, y - 4, 8, 8, parent)
         self.node = node
         self.setFlags(QGraphicsItem.ItemIsSelectable)
-        self.setData(0, node)
-        self.normal_pen     = QPen(theme.POINT_NORMAL_PEN, 1)
-        self.normal_brush   = QBrush(theme.POINT_NORMAL_FILL)
-        self.selected_pen   = QPen(theme.POINT_SEL_PEN, 3)
-        self.selected_brush = QBrush(theme.POINT_SEL_FILL)
+        self._ensure_pens()
         self.setPen(self.normal_pen)
         self.setBrush(self.normal_brush)
-
-    def mousePressEvent(self, event):
-        super().mousePressEvent(event)
-        if self.scene():
-            self.scene().node_clicked.emit(self.node)
+        # Appearance only changes on selection (setPen/setBrush invalidate
+        # the cache), so rasterise once per zoom level.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
     def set_selected_style(self, selected: bool):
         if selected:
@@ -126,19 +172,21 @@ class PreviewPointItem(QGraphicsEllipseItem):
 
 class PreviewLineItem(QGraphicsLineItem):
 
+    normal_pen = selected_pen = None
+
+    @classmethod
+    def _ensure_pens(cls):
+        if cls.normal_pen is None:
+            cls.normal_pen   = QPen(theme.LINK_NORMAL_COLOR, 2)
+            cls.selected_pen = QPen(theme.LINK_SEL_COLOR, 4)
+
     def __init__(self, x1, y1, x2, y2, node, parent=None):
         super().__init__(x1, y1, x2, y2, parent)
         self.node = node
         self.setFlags(QGraphicsItem.ItemIsSelectable)
-        self.setData(0, node)
-        self.normal_pen   = QPen(theme.LINK_NORMAL_COLOR, 2)
-        self.selected_pen = QPen(theme.LINK_SEL_COLOR, 4)
+        self._ensure_pens()
         self.setPen(self.normal_pen)
-
-    def mousePressEvent(self, event):
-        super().mousePressEvent(event)
-        if self.scene():
-            self.scene().node_clicked.emit(self.node)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
     def set_selected_style(self, selected: bool):
         if selected:
@@ -151,25 +199,24 @@ class PreviewLineItem(QGraphicsLineItem):
 
 class PreviewLinkLine(QGraphicsLineItem):
 
+    normal_pen = selected_pen = None
+
+    @classmethod
+    def _ensure_pens(cls):
+        if cls.normal_pen is None:
+            cls.normal_pen = QPen(theme.DASHED_LINK_COLOR, 1)
+            cls.normal_pen.setDashPattern(_LINK_DASH)
+            cls.selected_pen = QPen(theme.DASHED_SEL_COLOR, 2)
+            cls.selected_pen.setDashPattern(_LINK_DASH)
+
     def __init__(self, x1, y1, x2, y2, node, parent=None):
         super().__init__(x1, y1, x2, y2, parent)
         self.node = node
         self.setFlags(QGraphicsItem.ItemIsSelectable)
-        self.setData(0, node)
         self.setZValue(-1)
-        pen = QPen(theme.DASHED_LINK_COLOR, 1)
-        pen.setStyle(Qt.DashLine)
-        pen.setDashPattern([4, 4])
-        self.normal_pen   = pen
-        self.selected_pen = QPen(theme.DASHED_SEL_COLOR, 2)
-        self.selected_pen.setStyle(Qt.DashLine)
-        self.selected_pen.setDashPattern([4, 4])
+        self._ensure_pens()
         self.setPen(self.normal_pen)
-
-    def mousePressEvent(self, event):
-        super().mousePressEvent(event)
-        if self.scene():
-            self.scene().node_clicked.emit(self.node)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
     def set_selected_style(self, selected: bool):
         if selected:
@@ -180,61 +227,105 @@ class PreviewLinkLine(QGraphicsLineItem):
             self.setZValue(-1)
 
 
-def _is_preview_node_item(item) -> bool:
-    if isinstance(item, (QGraphicsEllipseItem, QGraphicsLineItem,
-                         QGraphicsPolygonItem, QGraphicsTextItem)):
-        return item.data(0) is not None
-    return False
-
-
 class PreviewScene(QGraphicsScene):
     node_clicked = Signal(object)
     def __init__(self):
         super().__init__()
+        # update_preview adds and removes items in bursts while hit tests
+        # only happen on clicks; a linear scan beats keeping a BSP tree
+        # rebalanced for a scene of this size.
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+
+    def mousePressEvent(self, event):
+        # One dispatch for every preview item class: resolve the topmost
+        # item under the cursor, whatever the button and whether or not it
+        # accepts the press.  Hit-testing uses the clicked view's transform
+        # so transform-ignoring labels are found where they are drawn.
+        super().mousePressEvent(event)
+        widget = event.widget()
+        view   = widget.parentWidget() if widget is not None else None
+        device = (view.viewportTransform()
+                  if isinstance(view, QGraphicsView) else QTransform())
+        item = self.itemAt(event.scenePos(), device)
+        while item is not None and getattr(item, 'node', None) is None:
+            item = item.parentItem()
+        if item is not None:
+            self.node_clicked.emit(item.node)
 
 
 # ---------------------------------------------------------------------------
 # Viewport helpers
 # ---------------------------------------------------------------------------
 
+# Arrow outlines relative to their tip; drawn by translating the painter.
+_S, _SH = _ARROW_HEAD, _ARROW_SHAFT
+_ARROW_LEFT = QPolygonF([
+    QPointF(0,        0),
+    QPointF(_S,       -_S*0.6),
+    QPointF(_S,       -_S*0.25),
+    QPointF(_S+_SH,   -_S*0.25),
+    QPointF(_S+_SH,    _S*0.25),
+    QPointF(_S,        _S*0.25),
+    QPointF(_S,        _S*0.6),
+])
+_ARROW_DOWN = QPolygonF([
+    QPointF(0,          0),
+    QPointF(-_S*0.6,    -_S),
+    QPointF(-_S*0.25,   -_S),
+    QPointF(-_S*0.25,   -_S-_SH),
+    QPointF( _S*0.25,   -_S-_SH),
+    QPointF( _S*0.25,   -_S),
+    QPointF( _S*0.6,    -_S),
+])
+del _S, _SH
+
+# (rgba, selected) → (outline pen, fill brush) for the overlay arrows
+_arrow_paint: dict = {}
+
+
+def _draw_arrow(p, template, tip_x, tip_y, color, selected):
+    key   = (color.rgba(), selected)
+    paint = _arrow_paint.get(key)
+    if paint is None:
+        fill  = color.lighter(170) if selected else color
+        paint = (QPen(color.darker(140), 1.5), QBrush(fill))
+        _arrow_paint[key] = paint
+    p.setPen(paint[0])
+    p.setBrush(paint[1])
+    p.translate(tip_x, tip_y)
+    p.drawPolygon(template)
+    p.translate(-tip_x, -tip_y)
+
+
 def _draw_arrow_left(p, tip_x, tip_y, color, selected=False):
-    s, sh = _ARROW_HEAD, _ARROW_SHAFT
-    poly = QPolygonF([
-        QPointF(tip_x,          tip_y),
-        QPointF(tip_x+s,        tip_y - s*0.6),
-        QPointF(tip_x+s,        tip_y - s*0.25),
-        QPointF(tip_x+s+sh,     tip_y - s*0.25),
-        QPointF(tip_x+s+sh,     tip_y + s*0.25),
-        QPointF(tip_x+s,        tip_y + s*0.25),
-        QPointF(tip_x+s,        tip_y + s*0.6),
-    ])
-    fill = color.lighter(170) if selected else color
-    p.setPen(QPen(color.darker(140), 1.5))
-    p.setBrush(QBrush(fill))
-    p.drawPolygon(poly)
+    _draw_arrow(p, _ARROW_LEFT, tip_x, tip_y, color, selected)
 
 
 def _draw_arrow_down(p, tip_x, tip_y, color, selected=False):
-    s, sh = _ARROW_HEAD, _ARROW_SHAFT
-    poly = QPolygonF([
-        QPointF(tip_x,           tip_y),
-        QPointF(tip_x-s*0.6,     tip_y-s),
-        QPointF(tip_x-s*0.25,    tip_y-s),
-        QPointF(tip_x-s*0.25,    tip_y-s-sh),
-        QPointF(tip_x+s*0.25,    tip_y-s-sh),
-        QPointF(tip_x+s*0.25,    tip_y-s),
-        QPointF(tip_x+s*0.6,     tip_y-s),
-    ])
-    fill = color.lighter(170) if selected else color
-    p.setPen(QPen(color.darker(140), 1.5))
-    p.setBrush(QBrush(fill))
-    p.drawPolygon(poly)
+    _draw_arrow(p, _ARROW_DOWN, tip_x, tip_y, color, selected)
+
+
+_LABEL_BG = QBrush(QColor(18, 20, 26, 210))
+
+# (font key, text) → (advance, height); overlay labels repeat every paint
+_label_sizes: dict = {}
+_LABEL_SIZES_MAX = 256
+
+
+def _label_size(font, text):
+    key  = (font.key(), text)
+    size = _label_sizes.get(key)
+    if size is None:
+        if len(_label_sizes) >= _LABEL_SIZES_MAX:
+            _label_sizes.clear()    # values change as the user edits
+        fm   = QFontMetrics(font)
+        size = (fm.horizontalAdvance(text), fm.height())
+        _label_sizes[key] = size
+    return size
 
 
 def _draw_label(p, text, x, y, color, align_right=False, align_bottom=False):
-    fm  = QFontMetrics(p.font())
-    tw  = fm.horizontalAdvance(text)
-    th  = fm.height()
+    tw, th = _label_size(p.font(), text)
     pad = 3
     vp  = p.viewport()
     rx  = (x - tw - pad*2) if align_right  else x
@@ -242,7 +333,7 @@ def _draw_label(p, text, x, y, color, align_right=False, align_bottom=False):
     rx  = max(2.0, min(float(rx), vp.width()  - tw - pad*2 - 2))
     ry  = max(2.0, min(float(ry), vp.height() - th - pad  - 2))
     p.setPen(Qt.NoPen)
-    p.setBrush(QBrush(QColor(18, 20, 26, 210)))
+    p.setBrush(_LABEL_BG)
     p.drawRoundedRect(QRectF(rx-pad, ry-pad, tw+pad*2, th+pad*2), 3, 3)
     p.setPen(color)
     p.setBrush(Qt.NoBrush)
@@ -258,29 +349,31 @@ def _build_excluded_set(flowchart_nodes: dict, connections: list) -> set:
     Return the set of node IDs belonging to inactive Decision branches.
     BFS from every inactive-branch output port, transitively.
     """
-    adj: dict[str, list[tuple[str, str]]] = {nid: [] for nid in flowchart_nodes}
+    decisions = [node for node in flowchart_nodes.values()
+                 if isinstance(node, DecisionNode)]
+    excluded: set = set()
+    if not decisions:
+        # No branches to prune, so the wire graph is not needed at all.
+        return excluded
+
+    adj: dict[str, list[tuple[str, str]]] = defaultdict(list)
     for conn in connections:
         fid = conn.get('from')
-        tid = conn.get('to')
-        fp  = conn.get('from_port', '')
-        if fid in adj:
-            adj[fid].append((tid, fp))
+        if fid in flowchart_nodes:
+            adj[fid].append((conn.get('to'), conn.get('from_port', '')))
 
-    excluded: set = set()
-    for node in flowchart_nodes.values():
-        if not isinstance(node, DecisionNode):
-            continue
+    for node in decisions:
         active_port   = 'yes' if node.condition_is_true else 'no'
         inactive_port = 'no'  if active_port == 'yes'   else 'yes'
 
         queue = deque()
-        for to_id, fp in adj.get(node.id, []):
+        for to_id, fp in adj.get(node.id, ()):
             if fp == inactive_port and to_id not in excluded:
                 excluded.add(to_id)
                 queue.append(to_id)
         while queue:
             cur = queue.popleft()
-            for to_id, _ in adj.get(cur, []):
+            for to_id, _ in adj.get(cur, ()):
                 if to_id not in excluded:
                     excluded.add(to_id)
                     queue.append(to_id)
@@ -294,12 +387,21 @@ def _build_excluded_set(flowchart_nodes: dict, connections: list) -> set:
 
 class GeometryPreview(BaseGraphicsView):
 
+    # Re-emits PreviewScene.node_clicked for the owning window
+    node_clicked = Signal(object)
+
     def __init__(self):
         super().__init__()
         self._pscene = PreviewScene()
         self.scene   = self._pscene
         self.setScene(self._pscene)
         self.setRenderHint(QPainter.Antialiasing)
+        # Repaint only the regions of changed items; every preview item
+        # restores what it changes on the painter.  Exposed regions keep
+        # Qt's antialiasing margin: thick selected pens would otherwise
+        # leave trails at item edges.
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
 
         self.scale_factor   = 20
         self.show_codes     = True
@@ -310,10 +412,26 @@ class GeometryPreview(BaseGraphicsView):
         self.links  = []
         self._target_overlays = []
 
+        # node_id → (node, signature, items, point position) from the last
+        # rebuild; unchanged nodes keep their items across update_preview.
+        self._node_cache = {}
+        self._topo_cache = None   # (topology key, ordered node ids)
+        # Latest (nodes, connections) received while hidden; see showEvent.
+        self._pending_update = None
+
+        # Paint resources for the background/foreground passes, built once
+        self._axis_pen = QPen(_AXIS_PEN_COLOR, _AXIS_PEN_WIDTH)
+        self._axis_pen.setCosmetic(True)
+        self._fg_font      = QFont("", 8)
+        self._fg_font_bold = QFont("", 8, QFont.Bold)
+
         self.setBackgroundBrush(QBrush(theme.PREVIEW_BG))
+        # Background + axes depend only on the view transform, so Qt can
+        # keep them as a pixmap and just shift it while panning.
+        self.setCacheMode(QGraphicsView.CacheBackground)
         self.setStyleSheet(theme.SCROLLBAR_STYLE)
         self.setup_scene()
-        self._pscene.node_clicked.connect(self.on_node_clicked)
+        self._pscene.node_clicked.connect(self.node_clicked.emit)
 
     def wheelEvent(self, event):
         zoom_factor = 1.15
@@ -335,53 +453,59 @@ class GeometryPreview(BaseGraphicsView):
             self.horizontalScrollBar().value() + delta.x())
         self.verticalScrollBar().setValue(
             self.verticalScrollBar().value() + delta.y())
-        self._rescale_text_items()
         event.accept()
 
-    def _rescale_text_items(self):
-        scale = self.transform().m11()
-        for item in self._pscene.items():
-            if isinstance(item, PreviewTextItem):
-                item.apply_scale(scale)
-
-    def on_node_clicked(self, node):
-        widget = self.parentWidget()
-        while widget:
-            if hasattr(widget, 'sync_selection_from_preview'):
-                widget.sync_selection_from_preview(node)
-                break
-            widget = widget.parentWidget()
-
     def restore_drag_mode(self):
         self.setDragMode(QGraphicsView.NoDrag)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Render whatever arrived while hidden, once, with the latest state.
+        pending = self._pending_update
+        if pending is not None:
+            self._pending_update = None
+            self.update_preview(*pending)
+
+    def _items_of(self, node):
+        """Preview items currently drawn for *node*."""
+        if node is None:
+            return ()
+        cached = self._node_cache.get(node.id)
+        if cached is None or cached[0] is not node:
+            return ()
+        return cached[2]
+
     def select_node_visually(self, node):
+        # Re-selecting the current node changes nothing; items rebuilt by
+        # update_preview are styled there.
+        if node is self.selected_node:
+            return
+        # Only the outgoing and incoming selections change style.
+        for item in self._items_of(self.selected_node):
+            item.set_selected_style(False)
         self.selected_node = node
-        for item in self._pscene.items():
-            if hasattr(item, 'set_selected_style'):
-                item.set_selected_style(getattr(item, 'node', None) == node)
+        for item in self._items_of(node):
+            item.set_selected_style(True)
         self.viewport().update()
 
     def setup_scene(self):
-        pass
+        """Reset item bookkeeping; called after the scene has been cleared."""
+        self._node_cache = {}
 
     # ------------------------------------------------------------------
-    # Coordinate helpers
+    # Background (cached) and foreground overlay
     # ------------------------------------------------------------------
 
-    def _origin_vp(self):
-        p = self.mapFromScene(QPointF(0.0, 0.0))
-        return float(p.x()), float(p.y())
-
-    def _sy_to_vpy(self, scene_y):
-        return float(self.mapFromScene(QPointF(0.0, scene_y)).y())
-
-    def _sx_to_vpx(self, scene_x):
-        return float(self.mapFromScene(QPointF(scene_x, 0.0)).x())
-
-    # ------------------------------------------------------------------
-    # Foreground overlay
-    # ------------------------------------------------------------------
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        # Scene coordinates: the axes are the x = 0 / y = 0 lines clipped
+        # to the exposed rect.
+        painter.save()
+        painter.setPen(self._axis_pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawLine(QPointF(rect.left(), 0.0), QPointF(rect.right(), 0.0))
+        painter.drawLine(QPointF(0.0, rect.top()), QPointF(0.0, rect.bottom()))
+        painter.restore()
 
     def drawForeground(self, painter, rect):
         super().drawForeground(painter, rect)
@@ -390,27 +514,23 @@ class GeometryPreview(BaseGraphicsView):
         painter.setRenderHint(QPainter.Antialiasing, True)
         vp_w = self.viewport().width()
         vp_h = self.viewport().height()
-        self._draw_axes_fg(painter, vp_w, vp_h)
+        # The view only scales and scrolls, so a world value maps to the
+        # viewport as value * scale + offset per axis; read the transform
+        # once instead of a mapFromScene() per overlay.
+        vt = self.viewportTransform()
+        kx, dx =  vt.m11() * self.scale_factor, vt.dx()
+        ky, dy = -vt.m22() * self.scale_factor, vt.dy()
         for ov in self._target_overlays:
             t, val, name, sel = ov['type'], ov['value'], ov['name'], ov.get('selected', False)
             if t == 'surface':
-                self._draw_surface_fg(painter, val, name, sel, vp_w, vp_h)
+                self._draw_surface_fg(painter, val*ky + dy, val, name, sel, vp_w, vp_h)
             elif t == 'elevation':
-                self._draw_elevation_fg(painter, val, name, sel, vp_w, vp_h)
+                self._draw_elevation_fg(painter, val*ky + dy, val, name, sel, vp_w, vp_h)
             elif t == 'offset':
-                self._draw_offset_fg(painter, val, name, sel, vp_w, vp_h)
+                self._draw_offset_fg(painter, val*kx + dx, val, name, sel, vp_w, vp_h)
         painter.restore()
 
-    def _draw_axes_fg(self, p, vp_w, vp_h):
-        ox, oy = self._origin_vp()
-        pen = QPen(_AXIS_PEN_COLOR, _AXIS_PEN_WIDTH)
-        pen.setCosmetic(True)
-        p.setPen(pen); p.setBrush(Qt.NoBrush)
-        p.drawLine(0, int(oy), vp_w, int(oy))
-        p.drawLine(int(ox), 0, int(ox), vp_h)
-
-    def _draw_surface_fg(self, p, value, name, selected, vp_w, vp_h):
-        vy = self._sy_to_vpy(-value * self.scale_factor)
+    def _draw_surface_fg(self, p, vy, value, name, selected, vp_w, vp_h):
         if vy < -2 or vy > vp_h + 2:
             return
         color = _SURFACE_COLOR.lighter(130) if selected else _SURFACE_COLOR
@@ -418,31 +538,29 @@ class GeometryPreview(BaseGraphicsView):
         pen.setDashPattern(_SURFACE_DASH); pen.setCosmetic(True)
         p.setPen(pen)
         p.drawLine(0, int(vy), vp_w, int(vy))
-        p.setFont(QFont("", 8, QFont.Bold))
+        p.setFont(self._fg_font_bold)
         _draw_label(p, f"Surface: {name}  [{value:+.3f}]",
                     x=_EDGE_MARGIN+4, y=vy-4, color=color, align_bottom=True)
 
-    def _draw_elevation_fg(self, p, value, name, selected, vp_w, vp_h):
-        vy    = self._sy_to_vpy(-value * self.scale_factor)
+    def _draw_elevation_fg(self, p, vy, value, name, selected, vp_w, vp_h):
         off_sc = vy < 0 or vy > vp_h
         vy_c  = max(float(_EDGE_MARGIN+_ARROW_HEAD+_ARROW_SHAFT+4),
                     min(vy, float(vp_h-_EDGE_MARGIN-_ARROW_HEAD-_ARROW_SHAFT-4)))
         color = _ELEV_COLOR.lighter(150) if selected else _ELEV_COLOR
         tip_x = float(vp_w) - _EDGE_MARGIN
-        p.setFont(QFont("", 8))
+        p.setFont(self._fg_font)
         _draw_arrow_left(p, tip_x, vy_c, color, selected)
         _draw_label(p, f"{'↕ ' if off_sc else ''}Elev: {name}  [{value:+.3f}]",
                     x=tip_x-_ARROW_SHAFT-_ARROW_HEAD-_LABEL_PAD, y=vy_c-7,
                     color=color, align_right=True)
 
-    def _draw_offset_fg(self, p, value, name, selected, vp_w, vp_h):
-        vx    = self._sx_to_vpx(value * self.scale_factor)
+    def _draw_offset_fg(self, p, vx, value, name, selected, vp_w, vp_h):
         off_sc = vx < 0 or vx > vp_w
         vx_c  = max(float(_EDGE_MARGIN+_ARROW_HEAD+_ARROW_SHAFT+4),
                     min(vx, float(vp_w-_EDGE_MARGIN-_ARROW_HEAD-_ARROW_SHAFT-4)))
         color = _OFFSET_COLOR.lighter(150) if selected else _OFFSET_COLOR
         tip_y = float(_EDGE_MARGIN+_ARROW_SHAFT+_ARROW_HEAD)
-        p.setFont(QFont("", 8))
+        p.setFont(self._fg_font)
         _draw_arrow_down(p, vx_c, tip_y, color, selected)
         _draw_label(p, f"{'↔ ' if off_sc else ''}Offset: {name}  [{value:+.3f}]",
                     x=vx_c-4, y=tip_y+_LABEL_PAD, color=color)
@@ -455,30 +573,41 @@ class GeometryPreview(BaseGraphicsView):
         """
         Sort nodes so that every node's inputs are rendered before its outputs.
         Uses the wire connection list for ordering.
+
+        Value edits leave the topology alone, so the id order is cached
+        against the node ids and edges and only recomputed when they change.
         """
-        in_degree = {nid: 0 for nid in flowchart_nodes}
-        adj       = {nid: [] for nid in flowchart_nodes}
+        key = (tuple(flowchart_nodes),
+               tuple((c.get('from'), c.get('to')) for c in connections))
+        if self._topo_cache is not None and self._topo_cache[0] == key:
+            return [flowchart_nodes[nid] for nid in self._topo_cache[1]]
+
+        # Only nodes with outgoing wires get an adjacency list; leaves,
+        # usually the majority, cost nothing beyond their in-degree slot.
+        in_degree = dict.fromkeys(flowchart_nodes, 0)
+        adj       = defaultdict(list)
 
         for conn in connections:
             f, t = conn.get('from'), conn.get('to')
-            if f in adj and t in in_degree:
+            if f in in_degree and t in in_degree:
                 adj[f].append(t)
                 in_degree[t] += 1
 
-        queue = deque(nid for nid in flowchart_nodes if in_degree[nid] == 0)
-        order = []
-        while queue:
-            nid = queue.popleft()
-            order.append(flowchart_nodes[nid])
-            for dep in adj[nid]:
+        # The output list doubles as the FIFO queue: iterating a list that
+        # grows during the loop visits the appended ids too, in order.
+        order    = [nid for nid, d in in_degree.items() if d == 0]
+        adj_get  = adj.get
+        for nid in order:
+            for dep in adj_get(nid, ()):
                 in_degree[dep] -= 1
                 if in_degree[dep] == 0:
-                    queue.append(dep)
+                    order.append(dep)
 
         if len(order) != len(flowchart_nodes):
             print("Warning: Circular dependency in flowchart")
-            return list(flowchart_nodes.values())
-        return order
+            order = list(flowchart_nodes)
+        self._topo_cache = (key, order)
+        return [flowchart_nodes[nid] for nid in order]
 
     # ------------------------------------------------------------------
     # Stamp wire IDs onto nodes so create_preview_items can look them up
@@ -490,35 +619,39 @@ class GeometryPreview(BaseGraphicsView):
         node so that create_preview_items() can locate the correct upstream
         position in point_positions without needing legacy ID fields.
         """
+        nodes = self._nodes_ref
         for conn in connections:
-            from_id   = conn.get('from')
-            to_id     = conn.get('to')
-            from_port = conn.get('from_port', '')
-            to_port   = conn.get('to_port',   '')
-
-            # PointNode receiving a position on its 'reference' port
-            if to_port == 'reference':
-                node = self._nodes_ref.get(to_id)
-                if node:
-                    node._wire_ref_id = from_id
-
-            # LinkNode receiving positions on 'start' / 'end' ports
-            if to_port == 'start':
-                node = self._nodes_ref.get(to_id)
-                if node:
-                    node._wire_start_id = from_id
-            if to_port == 'end':
-                node = self._nodes_ref.get(to_id)
-                if node:
-                    node._wire_end_id = from_id
+            # PointNode 'reference', LinkNode 'start' / 'end'; others skip
+            attr = _WIRE_ID_ATTRS.get(conn.get('to_port', ''))
+            if attr is None:
+                continue
+            node = nodes.get(conn.get('to'))
+            if node:
+                setattr(node, attr, conn.get('from'))
 
     # ------------------------------------------------------------------
     # Main update entry point
     # ------------------------------------------------------------------
 
+    def _preview_signature(self, node, point_positions):
+        """
+        Everything create_preview_items() reads: the node's own state (minus
+        its canvas placement), the upstream positions its wires point at and
+        the render options.
+        """
+        upstream = tuple(
+            point_positions.get(getattr(node, attr, None))
+            for attr in _WIRE_ID_ATTRS.values()
+        )
+        state = repr([(k, v) for k, v in vars(node).items()
+                      if k not in _CANVAS_ATTRS])
+        return (state, upstream, self.show_codes, self.scale_factor)
+
     def update_preview(self, flowchart_nodes: dict, connections: list = None):
         """
-        Rebuild all preview items.
+        Bring the preview items in line with the flowchart.  Nodes whose
+        signature is unchanged since the last call keep their items; only
+        new, changed and removed nodes touch the scene.
 
         Parameters
         ----------
@@ -526,25 +659,27 @@ class GeometryPreview(BaseGraphicsView):
             All nodes in the scene.
         connections : list[dict]
             All wire connections (from scene.connections).
+
+        While the view is hidden only the arguments are kept; showEvent
+        renders the last of them.
         """
-        from .models.targets import (SurfaceTargetNode,
-                                     ElevationTargetNode,
-                                     OffsetTargetNode)
+        if not self.isVisible():
+            self._pending_update = (flowchart_nodes, connections)
+            return
+        self._pending_update = None
 
         conn_list = connections or []
 
         # Store reference for _stamp_wire_ids
         self._nodes_ref = flowchart_nodes
 
-        # Remove old preview items
-        for item in list(self._pscene.items()):
-            if _is_preview_node_item(item):
-                self._pscene.removeItem(item)
-
         self.points.clear()
         self.links.clear()
         self._target_overlays.clear()
 
+        old_cache = self._node_cache
+        new_cache = {}
+
         # Stamp wire source IDs onto nodes so create_preview_items can use them
         self._stamp_wire_ids(conn_list)
 
@@ -556,25 +691,23 @@ class GeometryPreview(BaseGraphicsView):
 
         sorted_nodes = self._topological_sort(flowchart_nodes, conn_list)
 
+        # Everything the builders receive is fixed for the whole pass, so
+        # resolve it once instead of re-reading attributes per node.
+        pscene       = self._pscene
+        scale_factor = self.scale_factor
+        show_codes   = self.show_codes
+        signature    = self._preview_signature
+        overlay_type = _overlay_type
+
         for node in sorted_nodes:
             if node.id in excluded:
                 continue
 
-            if isinstance(node, SurfaceTargetNode):
-                self._target_overlays.append({
-                    'type': 'surface', 'value': node.preview_value,
-                    'name': node.name, 'selected': node is selected_node,
-                })
-                continue
-            if isinstance(node, ElevationTargetNode):
-                self._target_overlays.append({
-                    'type': 'elevation', 'value': node.preview_value,
-                    'name': node.name, 'selected': node is selected_node,
-                })
-                continue
-            if isinstance(node, OffsetTargetNode):
+            # One memoised lookup classifies every target type at once.
+            overlay = overlay_type(node.__class__)
+            if overlay is not None:
                 self._target_overlays.append({
-                    'type': 'offset', 'value': node.preview_value,
+                    'type': overlay, 'value': node.preview_value,
                     'name': node.name, 'selected': node is selected_node,
                 })
                 continue
@@ -582,16 +715,47 @@ class GeometryPreview(BaseGraphicsView):
             if isinstance(node, DecisionNode):
                 continue
 
+            cached = old_cache.pop(node.id, None)
+            if cached is not None:
+                c_node, c_sig, c_items, c_pos = cached
+                if (c_node is node and
+                        c_sig == signature(node, point_positions)):
+                    if c_pos is not None:
+                        point_positions[node.id] = c_pos
+                    new_cache[node.id] = cached
+                    continue
+                for item in c_items:
+                    pscene.removeItem(item)
+
+            items = ()
             try:
                 items = node.create_preview_items(
-                    self._pscene, self.scale_factor,
-                    self.show_codes, point_positions,
+                    pscene, scale_factor, show_codes, point_positions,
                 )
                 for item in items:
-                    self._pscene.addItem(item)
+                    pscene.addItem(item)
+                    if node is selected_node:
+                        item.set_selected_style(True)
             except Exception as e:
                 print(f"Error creating preview for {node.type} {node.name}: {e}")
                 traceback.print_exc()
-
-        self._rescale_text_items()
+                # The node is left out of the cache, so nothing would ever
+                # remove what was added before the failure.
+                for item in items:
+                    if item.scene() is pscene:
+                        pscene.removeItem(item)
+                continue
+            # Signed after the call: rendering resolves the node's inputs,
+            # so the next pass compares against the settled state.
+            new_cache[node.id] = (
+                node, signature(node, point_positions),
+                items, point_positions.get(node.id),
+            )
+
+        # Nodes deleted, excluded or turned into overlays since last time
+        for _node, _sig, items, _pos in old_cache.values():
+            for item in items:
+                pscene.removeItem(item)
+
+        self._node_cache = new_cache
         self.viewport().update()
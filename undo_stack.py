@@ -18,6 +18,8 @@ ChangeValueCommand   – any port-editor value change (spinbox, lineedit, …)
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from .models.base import parse_codes
+
 if TYPE_CHECKING:
     from .flowchart import FlowchartScene
 
@@ -78,11 +80,8 @@ class DeleteNodeCommand(Command):
         self._x = item.node.x
         self._y = item.node.y
 
-        # Snapshot every wire that touches this node so we can restore them
-        self._affected_wires = [
-            dict(w) for w in scene.port_wires
-            if w['from_item'] is item or w['to_item'] is item
-        ]
+        # Snapshot every connection that touches this node so we can
+        # restore its wires
         self._affected_connections = [
             dict(c) for c in scene.connections
             if c['from'] == self._node.id or c['to'] == self._node.id
@@ -211,8 +210,7 @@ class ChangeValueCommand(Command):
 
         # Mirror the logic in FlowchartNodeItem._on_value_changed
         if port in ('point_codes', 'link_codes') and isinstance(value, str):
-            codes = [c.strip() for c in value.split(',') if c.strip()]
-            setattr(node, port, codes)
+            setattr(node, port, parse_codes(value))
         elif port in ('point_codes', 'link_codes') and isinstance(value, list):
             setattr(node, port, value)
         else:
@@ -225,29 +223,11 @@ class ChangeValueCommand(Command):
 
         # Refresh the widget editor to reflect the applied value
         pr = self._item.ports.get(port)
-        if pr and pr._editor is not None:
-            self._sync_editor(pr._editor, value)
+        if pr:
+            pr.set_editor_value(value)
 
         self._scene.request_preview_update()
 
-    @staticmethod
-    def _sync_editor(editor, value):
-        from PySide2.QtWidgets import (QDoubleSpinBox, QSpinBox,
-                                       QLineEdit, QCheckBox)
-        editor.blockSignals(True)
-        try:
-            if isinstance(editor, (QDoubleSpinBox, QSpinBox)):
-                editor.setValue(value if value is not None else 0)
-            elif isinstance(editor, QLineEdit):
-                if isinstance(value, list):
-                    editor.setText(', '.join(str(v) for v in value))
-                else:
-                    editor.setText(str(value) if value is not None else '')
-            elif isinstance(editor, QCheckBox):
-                editor.setChecked(bool(value))
-        finally:
-            editor.blockSignals(False)
-
 
 class RenameNodeCommand(Command):
     """Records a node name change."""
@@ -269,9 +249,7 @@ class RenameNodeCommand(Command):
 
     def _set(self, name: str):
         self._item.node.name = name
-        self._item._header_label.setText(
-            f"{self._item.node.type}  ·  {name}"
-        )
+        self._item._header_label.setText(self._item._header_text(name))
         self._scene.request_preview_update()
 
 